@@ -0,0 +1,102 @@
+"""partition login_attempts by month
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+Rebuilds login_attempts as a table range-partitioned on attempted_at, with
+one partition per month (login_attempts_yYYYYmMM) from the oldest existing
+row through two months ahead. MaintenanceService keeps future partitions
+ready and drops expired ones.
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision        : str = "0002"
+down_revision   : Union[str, None] = "0001"
+branch_labels   : Union[str, Sequence[str], None] = None
+depends_on      : Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 2
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE login_attempts RENAME TO login_attempts_legacy")
+    op.execute("ALTER TABLE login_attempts_legacy RENAME CONSTRAINT login_attempts_pkey TO login_attempts_legacy_pkey")
+    op.execute("ALTER SEQUENCE login_attempts_id_seq RENAME TO login_attempts_legacy_id_seq")
+    op.drop_index("ix_login_attempts_id", table_name="login_attempts_legacy")
+    op.drop_index("ix_login_attempts_email", table_name="login_attempts_legacy")
+    op.drop_index("ix_login_attempts_attempted_at", table_name="login_attempts_legacy")
+
+    op.create_table(
+        "login_attempts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("ip_address", sa.String(length=45), nullable=False),
+        sa.Column("success", sa.Boolean(), nullable=False),
+        sa.Column("attempted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id", "attempted_at"),
+        postgresql_partition_by = "RANGE (attempted_at)"
+    )
+    op.create_index("ix_login_attempts_email", "login_attempts", ["email"])
+    op.create_index("ix_login_attempts_attempted_at", "login_attempts", ["attempted_at"])
+
+    connection  = op.get_bind()
+    oldest      = connection.execute(sa.text("SELECT min(attempted_at) FROM login_attempts_legacy")).scalar()
+    today       = date.today()
+    month       = date(oldest.year, oldest.month, 1) if oldest is not None else date(today.year, today.month, 1)
+    last        = date(today.year, today.month, 1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+
+    while month <= last:
+        upper = _next_month(month)
+        op.execute(
+            f"CREATE TABLE login_attempts_y{month.year:04d}m{month.month:02d} PARTITION OF login_attempts "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+        )
+        month = upper
+
+    op.execute(
+        "INSERT INTO login_attempts (id, email, ip_address, success, attempted_at) "
+        "SELECT id, email, ip_address, success, attempted_at FROM login_attempts_legacy"
+    )
+    op.execute("SELECT setval('login_attempts_id_seq', COALESCE((SELECT max(id) FROM login_attempts), 0) + 1, false)")
+    op.drop_table("login_attempts_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE login_attempts RENAME TO login_attempts_partitioned")
+    op.execute("ALTER SEQUENCE login_attempts_id_seq RENAME TO login_attempts_partitioned_id_seq")
+    op.drop_index("ix_login_attempts_email", table_name="login_attempts_partitioned")
+    op.drop_index("ix_login_attempts_attempted_at", table_name="login_attempts_partitioned")
+    op.execute("ALTER TABLE login_attempts_partitioned RENAME CONSTRAINT login_attempts_pkey TO login_attempts_partitioned_pkey")
+
+    op.create_table(
+        "login_attempts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("ip_address", sa.String(length=45), nullable=False),
+        sa.Column("success", sa.Boolean(), nullable=False),
+        sa.Column("attempted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_login_attempts_id", "login_attempts", ["id"])
+    op.create_index("ix_login_attempts_email", "login_attempts", ["email"])
+    op.create_index("ix_login_attempts_attempted_at", "login_attempts", ["attempted_at"])
+
+    op.execute(
+        "INSERT INTO login_attempts (id, email, ip_address, success, attempted_at) "
+        "SELECT id, email, ip_address, success, attempted_at FROM login_attempts_partitioned"
+    )
+    op.execute("SELECT setval('login_attempts_id_seq', COALESCE((SELECT max(id) FROM login_attempts), 0) + 1, false)")
+    op.drop_table("login_attempts_partitioned")
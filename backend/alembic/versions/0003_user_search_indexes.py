@@ -0,0 +1,62 @@
+"""user search indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+Expression indexes for UserSearchService. The text_pattern_ops btree indexes
+serve prefix matches (LIKE 'q%') and are always created. The pg_trgm GIN
+indexes serve fuzzy matches and are only created where the extension is
+available; without them, run with USER_SEARCH_BACKEND=prefix. All of them
+are built with CREATE INDEX CONCURRENTLY, so writes to users continue.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision        : str = "0003"
+down_revision   : Union[str, None] = "0002"
+branch_labels   : Union[str, Sequence[str], None] = None
+depends_on      : Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    ("ix_users_username_prefix" , "(lower(username) text_pattern_ops)"),
+    ("ix_users_email_prefix"    , "(lower(email) text_pattern_ops)"),
+)
+
+TRIGRAM_INDEXES = (
+    ("ix_users_username_trgm"   , "USING gin (lower(username) gin_trgm_ops)"),
+    ("ix_users_email_trgm"      , "USING gin (lower(email) gin_trgm_ops)"),
+)
+
+
+def _create_concurrently(name: str, definition: str) -> None:
+    # A failed concurrent build leaves an invalid index behind; dropping it
+    # first makes re-running the migration safe.
+    op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute(f"CREATE INDEX CONCURRENTLY {name} ON users {definition}")
+
+
+def upgrade() -> None:
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if available:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # users is large and written to constantly: build without the SHARE lock
+    # a plain CREATE INDEX holds for the whole build. CONCURRENTLY cannot run
+    # inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES + (TRIGRAM_INDEXES if available else ()):
+            _create_concurrently(name, definition)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in TRIGRAM_INDEXES + INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,47 @@
+"""hourly login attempt rollups
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+Existing history is not aggregated here; run
+``python -m app.commands.backfill_login_rollups`` after upgrading.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision        : str = "0004"
+down_revision   : Union[str, None] = "0003"
+branch_labels   : Union[str, Sequence[str], None] = None
+depends_on      : Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "login_attempt_hourly_by_email",
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("successes", sa.Integer(), nullable=False),
+        sa.Column("failures", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("bucket", "email")
+    )
+    op.create_index("ix_login_attempt_hourly_by_email_email", "login_attempt_hourly_by_email", ["email"])
+
+    op.create_table(
+        "login_attempt_hourly_by_ip",
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ip_address", sa.String(length=45), nullable=False),
+        sa.Column("successes", sa.Integer(), nullable=False),
+        sa.Column("failures", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("bucket", "ip_address")
+    )
+    op.create_index("ix_login_attempt_hourly_by_ip_ip_address", "login_attempt_hourly_by_ip", ["ip_address"])
+
+
+def downgrade() -> None:
+    op.drop_table("login_attempt_hourly_by_ip")
+    op.drop_table("login_attempt_hourly_by_email")
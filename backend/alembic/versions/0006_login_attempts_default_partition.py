@@ -0,0 +1,28 @@
+"""default partition for login_attempts
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+
+Catches rows outside every monthly partition, so inserts keep working when
+maintenance has not created the month yet. MaintenanceService moves such
+rows into their monthly partition once it creates it.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision        : str = "0006"
+down_revision   : Union[str, None] = "0005"
+branch_labels   : Union[str, Sequence[str], None] = None
+depends_on      : Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TABLE login_attempts_default PARTITION OF login_attempts DEFAULT")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE login_attempts_default")
@@ -0,0 +1,54 @@
+"""
+Rebuild the hourly login attempt rollups from login_attempts.
+
+    python -m app.commands.backfill_login_rollups [--since 2026-01-01T00:00] [--until ...] [--verify]
+
+``--since`` defaults to the oldest attempt, ``--until`` to the start of the
+current hour (live hours are maintained by the writer). ``--verify`` only
+compares the rollups with a brute-force aggregate and exits non-zero on any
+difference.
+"""
+import argparse
+import sys
+
+from datetime import datetime, timezone
+
+from sqlalchemy import select, func
+
+from app.core.logger import logger
+from app.database import SessionLocal
+from app.database.models.auth_model import LoginAttempt
+from app.services.login_stats_service import LoginStatsService
+from app.utils.stats_range import as_utc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill or verify hourly login attempt rollups")
+    parser.add_argument("--since", type=datetime.fromisoformat)
+    parser.add_argument("--until", type=datetime.fromisoformat)
+    parser.add_argument("--verify", action="store_true")
+    args = parser.parse_args()
+
+    until = as_utc(args.until) if args.until else datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    since = as_utc(args.since) if args.since else None
+    if since is None:
+        with SessionLocal() as db:
+            since = db.scalar(select(func.min(LoginAttempt.attempted_at)))
+        if since is None:
+            logger.info("No login attempts to aggregate")
+            return 0
+
+    if args.verify:
+        mismatches = LoginStatsService.verify(since, until)
+        for mismatch in mismatches:
+            logger.error(mismatch)
+        logger.info(f"{len(mismatches)} rollup mismatches between {since.isoformat()} and {until.isoformat()}")
+        return 1 if mismatches else 0
+
+    written = LoginStatsService.backfill(since, until)
+    logger.info(f"Wrote {written} rollup rows between {since.isoformat()} and {until.isoformat()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
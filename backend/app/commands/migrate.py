@@ -0,0 +1,83 @@
+"""
+Bring the database to the latest Alembic revision; run by the container
+entrypoint before the server starts.
+
+    python -m app.commands.migrate [--adopt-legacy]
+
+Replicas starting together serialize on an advisory lock, so only one of them
+runs the migrations. A database created by ``create_all`` (before migrations
+existed) has tables but no alembic_version; it is refused unless
+``--adopt-legacy`` is given. That converts it to revision 0001 (token column
+width, index names), stamps it and upgrades. Refresh tokens stored raw before
+they were hashed can no longer be matched, so they are deleted and every user
+has to log in again.
+"""
+import argparse
+import sys
+
+from sqlalchemy import inspect, select, func, text
+
+from app.core.logger import logger
+from app.database import engine
+from app.database.migrations import ALEMBIC_INI
+
+MIGRATION_LOCK_KEY = 0x6D696772617465
+
+# Indexes created by the old init.sql, duplicated by the ix_* indexes of 0001.
+LEGACY_INDEXES = (
+    "idx_users_email",
+    "idx_users_username",
+    "idx_refresh_tokens_user_id",
+    "idx_refresh_tokens_expires_at",
+    "idx_login_attempts_email",
+    "idx_login_attempts_attempted_at",
+)
+
+LEGACY_TO_0001 = (
+    "DELETE FROM refresh_tokens",
+    "ALTER TABLE refresh_tokens ALTER COLUMN token TYPE varchar(64)",
+    *(f"DROP INDEX IF EXISTS {name}" for name in LEGACY_INDEXES),
+    "CREATE INDEX IF NOT EXISTS ix_refresh_tokens_user_id ON refresh_tokens (user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_refresh_tokens_expires_at ON refresh_tokens (expires_at)",
+    "CREATE INDEX IF NOT EXISTS ix_login_attempts_attempted_at ON login_attempts (attempted_at)",
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Upgrade the database to the latest migration")
+    parser.add_argument("--adopt-legacy", action="store_true", help="convert a create_all database to revision 0001 first")
+    args = parser.parse_args()
+
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    with engine.connect() as lock:
+        lock.execute(select(func.pg_advisory_lock(MIGRATION_LOCK_KEY)))
+        try:
+            tables = set(inspect(lock).get_table_names())
+            lock.commit()
+            if "users" in tables and "alembic_version" not in tables:
+                if not args.adopt_legacy:
+                    logger.error(
+                        "Database was created without migrations; run `python -m app.commands.migrate --adopt-legacy` "
+                        "once (this deletes all refresh tokens), see README"
+                    )
+                    return 1
+                with engine.begin() as conn:
+                    for statement in LEGACY_TO_0001:
+                        conn.execute(text(statement))
+                command.stamp(config, "0001")
+                logger.warning("Adopted legacy schema as revision 0001; existing refresh tokens were deleted")
+
+            command.upgrade(config, "head")
+        finally:
+            lock.execute(select(func.pg_advisory_unlock(MIGRATION_LOCK_KEY)))
+            lock.commit()
+
+    logger.info("Database is at the latest migration")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
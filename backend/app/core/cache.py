@@ -0,0 +1,218 @@
+import json
+import math
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.core.metrics import CACHE_EVICTIONS, CACHE_REQUESTS
+
+
+class CacheStats:
+    """Per-process counters of one cache, also exported as Prometheus metrics labelled ``name``."""
+
+    def __init__(self, name: str):
+        self.name       = name
+        self.hits       = 0
+        self.misses     = 0
+        self.evictions  = 0
+
+    def hit(self) -> None:
+        self.hits += 1
+        CACHE_REQUESTS.labels(self.name, "hit").inc()
+
+    def miss(self) -> None:
+        self.misses += 1
+        CACHE_REQUESTS.labels(self.name, "miss").inc()
+
+    def evict(self) -> None:
+        self.evictions += 1
+        CACHE_EVICTIONS.labels(self.name).inc()
+
+    def as_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class LocalCache:
+    """
+    Async variants of the cache interface for in-process backends: nothing
+    blocks on I/O, so they call the sync methods directly. Every backend
+    offers ``get``/``set``/``add``/``delete`` and ``aget``/``aset``/``aadd``/
+    ``adelete``; the async stack uses the latter.
+    """
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.set(key, value, ttl)
+
+    async def aadd(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        return self.add(key, value, ttl)
+
+    async def adelete(self, *keys: str) -> None:
+        self.delete(*keys)
+
+
+class NullCache(LocalCache):
+    """Cache backend that stores nothing; used when caching is disabled."""
+
+    def __init__(self, name: str = "cache"):
+        self.stats = CacheStats(name)
+
+    def get(self, key: str) -> Optional[Any]:
+        self.stats.miss()
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        return True
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCache(LocalCache):
+    """
+    In-process LRU cache with a per-entry TTL and a hard size bound. Expired
+    entries are dropped lazily on read; the least recently used entry is
+    evicted when ``max_size`` is reached.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float, name: str = "cache"):
+        self.max_size   = max_size
+        self.ttl        = ttl_seconds
+        self.stats      = CacheStats(name)
+        self._data      : "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock      = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats.miss()
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.stats.miss()
+                return None
+
+            self._data.move_to_end(key)
+            self.stats.hit()
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """Set ``key`` only if it holds no live entry; return whether it was set."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def _store(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.stats.evict()
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache:
+    """
+    Redis-backed cache storing JSON values with a TTL. ``client`` only needs
+    ``get``, ``set(key, value, ex=..., nx=...)`` and ``delete``, so an
+    in-memory stand-in can replace a real ``redis.Redis`` in tests. The
+    ``a*`` methods use ``async_client`` (a ``redis.asyncio.Redis``) so the
+    async stack never blocks the event loop on Redis. Evictions happen
+    server-side and are not counted here.
+    """
+
+    def __init__(self, client, ttl_seconds: int, prefix: str = "cache:", async_client=None):
+        self.client         = client
+        self.async_client   = async_client
+        self.ttl            = ttl_seconds
+        self.prefix         = prefix
+        self.stats          = CacheStats(prefix.rstrip(":"))
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._decode(self.client.get(self.prefix + key))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.client.set(self.prefix + key, json.dumps(value), ex=self._expiry(ttl))
+
+    def add(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        return bool(self.client.set(self.prefix + key, json.dumps(value), ex=self._expiry(ttl), nx=True))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return self._decode(await self.async_client.get(self.prefix + key))
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self.async_client.set(self.prefix + key, json.dumps(value), ex=self._expiry(ttl))
+
+    async def aadd(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        return bool(await self.async_client.set(self.prefix + key, json.dumps(value), ex=self._expiry(ttl), nx=True))
+
+    async def adelete(self, *keys: str) -> None:
+        if keys:
+            await self.async_client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        pass
+
+    def _expiry(self, ttl: Optional[float]) -> int:
+        return max(math.ceil(self.ttl if ttl is None else ttl), 1)
+
+    def _decode(self, raw) -> Optional[Any]:
+        if raw is None:
+            self.stats.miss()
+            return None
+        self.stats.hit()
+        return json.loads(raw)
+
+
+def create_cache(backend: str, max_size: int, ttl_seconds: int, prefix: str):
+    if backend == "memory":
+        return MemoryCache(max_size=max_size, ttl_seconds=ttl_seconds, name=prefix.rstrip(":"))
+    if backend == "redis":
+        import redis
+        import redis.asyncio
+
+        return RedisCache(
+            redis.Redis.from_url(settings.REDIS_URL),
+            ttl_seconds     = ttl_seconds,
+            prefix          = prefix,
+            async_client    = redis.asyncio.Redis.from_url(settings.REDIS_URL)
+        )
+    if backend == "none":
+        return NullCache(name=prefix.rstrip(":"))
+    raise ValueError(f"Unknown cache backend: {backend}")
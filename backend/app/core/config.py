@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, model_validator
+from typing import Dict, List
 
 class Settings(BaseSettings):
     # Application Settings
@@ -13,21 +14,143 @@ class Settings(BaseSettings):
     POSTGRES_DB                 : str = Field(description="PostgreSQL database name")
     POSTGRES_USER               : str = Field(description="PostgreSQL username")
     POSTGRES_PASSWORD           : str = Field(description="PostgreSQL password")
+    POSTGRES_HOST               : str = Field(default="localhost", description="PostgreSQL primary host")
     POSTGRES_PORT               : int = Field(default=5432, description="PostgreSQL port")
+    DB_REPLICA_URLS             : List[str] = Field(default=[], description="Read replica URLs, as a JSON list")
+    DB_REPLICA_RETRY_SECONDS    : int = Field(default=30, description="How long an unreachable replica is skipped")
+    DB_READ_YOUR_WRITES_SECONDS : int = Field(default=5, description="Reads go to the primary for this long after a client's write")
     DB_POOL_SIZE                : int = Field(default=10, description="Database pool size")
+    DB_MAX_OVERFLOW             : int = Field(default=10, description="Connections allowed beyond DB_POOL_SIZE")
+    DB_MAX_CONNECTIONS          : int = Field(default=100, description="Postgres connection budget shared by all workers; 0 disables pool clamping")
+    DB_RESERVED_CONNECTIONS     : int = Field(default=10, description="Connections kept free for migrations and admin sessions")
+    WEB_CONCURRENCY             : int = Field(default=1, description="Worker processes sharing DB_MAX_CONNECTIONS")
+    THREADPOOL_SIZE             : int = Field(default=0, description="Worker threads for sync handlers; 0 sizes it to DB_POOL_SIZE + DB_MAX_OVERFLOW")
+    BULK_USER_CHUNK_SIZE        : int = Field(default=1000, description="Rows per multi-row INSERT during bulk import")
+    BULK_USER_MAX_ROWS          : int = Field(default=10000, description="Maximum rows accepted by one bulk request")
+    USER_EXPORT_BATCH_SIZE      : int = Field(default=1000, description="Rows fetched per server-side cursor batch when exporting users")
+    USER_SEARCH_BACKEND         : str = Field(default="trigram", description="User search: trigram (needs pg_trgm) or prefix")
+    USER_SEARCH_MAX_LIMIT       : int = Field(default=50, description="Most results returned by one search page")
+    FAST_SERIALIZATION          : bool = Field(default=False, description="Serve user and token responses through the orjson fast path")
+    DB_VERIFY_MIGRATIONS        : bool = Field(default=True, description="Refuse to start unless the database is at the latest Alembic revision")
+    DB_ASYNC                    : bool = Field(default=False, description="Serve the API from the async (asyncpg) database stack")
+
+    # Cache Settings
+    REDIS_URL                   : str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    USER_CACHE_BACKEND          : str = Field(default="auto", description="User lookup cache: memory (single worker only), redis, none, or auto")
+    USER_CACHE_TTL_SECONDS      : int = Field(default=60, description="User cache entry lifetime")
+    USER_CACHE_MAX_SIZE         : int = Field(default=10000, description="Maximum entries in the in-process user cache")
 
     # Security Settings
-    SECRET_KEY                  : str = Field(description="Secret key for JWT")
-    ALGORITHM                   : str = Field(default="HS256", description="JWT algorithm")
-    ACCESS_TOKEN_EXPIRE_MINUTES : int = Field(default=30, description="Token expiry time")
-    
+    SECRET_KEY                       : str = Field(description="Secret key for JWT")
+    ALGORITHM                        : str = Field(default="HS256", description="JWT algorithm")
+    ACCESS_TOKEN_EXPIRE_MINUTES      : int = Field(default=30, description="Token expiry time")
+    ACCESS_TOKEN_CACHE_SIZE          : int = Field(default=10000, description="Decoded access tokens kept in memory")
+    REVOCATION_SYNC_INTERVAL_SECONDS : int = Field(default=5, description="How often each worker pulls revoked access tokens from Postgres")
+    REVOCATION_SYNC_OVERLAP_SECONDS  : int = Field(default=60, description="Re-read window covering revocations committed out of order")
+
+    # Password Hashing
+    BCRYPT_ROUNDS               : int = Field(default=12, description="bcrypt cost factor for new hashes")
+    HASH_POOL_KIND              : str = Field(default="process", description="Hashing pool type: process or thread")
+    HASH_POOL_SIZE              : int = Field(default=2, description="Number of hashing workers")
+    HASH_QUEUE_SIZE             : int = Field(default=32, description="Hashing jobs allowed to wait for a worker before returning 503")
+    HASH_BULK_CHUNK_SIZE        : int = Field(default=32, description="Passwords per hashing job during bulk import")
+
+    # Login Throttling
+    LOGIN_THROTTLE_ENABLED          : bool = Field(default=True, description="Reject login bursts before bcrypt runs")
+    LOGIN_THROTTLE_BACKEND          : str = Field(default="memory", description="Throttle counters: memory (per worker) or redis (shared)")
+    LOGIN_THROTTLE_WINDOW_SECONDS   : int = Field(default=60, description="Sliding window length")
+    LOGIN_THROTTLE_EMAIL_LIMIT      : int = Field(default=10, description="Login attempts allowed per email per window")
+    LOGIN_THROTTLE_IP_LIMIT         : int = Field(default=100, description="Login attempts allowed per client IP per window")
+    LOGIN_THROTTLE_MAX_KEYS         : int = Field(default=100000, description="Keys tracked by each in-process limiter")
+
+    # Login Audit
+    LOGIN_ATTEMPT_BATCH_SIZE         : int = Field(default=500, description="Login attempts written per batch")
+    LOGIN_ATTEMPT_FLUSH_INTERVAL_MS  : int = Field(default=1000, description="Maximum delay before buffered login attempts are written")
+    LOGIN_ATTEMPT_BUFFER_SIZE        : int = Field(default=10000, description="Maximum buffered login attempts before new ones are dropped")
+    LOGIN_ATTEMPT_MAX_WRITE_ATTEMPTS : int = Field(default=5, description="Failed writes of one batch before it is dropped")
+    LOGIN_STATS_MAX_HOURS            : int = Field(default=744, description="Widest range served by /auths/attempts/stats")
+
+    # Profiling
+    PROFILING_ENABLED           : bool = Field(default=False, description="Emit Server-Timing headers and log slow requests")
+    SLOW_REQUEST_THRESHOLD_MS   : int = Field(default=500, description="Requests slower than this are logged")
+    PROFILING_SLOWEST_STATEMENTS: int = Field(default=3, description="Slowest SQL statements kept per request for the slow log")
+    PROFILING_PRIVATE_PREFIXES  : List[str] = Field(default=["/api/v1/auths"], description="Paths whose Server-Timing omits named segments such as hash")
+
+    # Idempotency
+    IDEMPOTENCY_ENABLED            : bool = Field(default=True, description="Honour Idempotency-Key on POST requests")
+    IDEMPOTENCY_BACKEND            : str = Field(default="memory", description="Idempotency record store: memory or redis")
+    IDEMPOTENCY_TTL_SECONDS        : int = Field(default=3600, description="How long a completed response is replayed")
+    IDEMPOTENCY_MAX_KEYS           : int = Field(default=10000, description="Records kept by the in-process store")
+    IDEMPOTENCY_LOCK_SECONDS       : int = Field(default=60, description="Lifetime of the in-progress marker if a worker dies mid-request")
+    IDEMPOTENCY_MAX_BODY_BYTES     : int = Field(default=1048576, description="Larger request bodies skip idempotency handling")
+    IDEMPOTENCY_MAX_RESPONSE_BYTES : int = Field(default=65536, description="Larger responses are coalesced but not stored")
+    IDEMPOTENCY_EXCLUDED_PATHS     : List[str] = Field(default=["/api/v1/auths/login", "/api/v1/auths/refresh"], description="Paths never handled, as a JSON list; their responses carry tokens")
+
+    # Maintenance
+    MAINTENANCE_ENABLED            : bool = Field(default=True, description="Run retention jobs in the background")
+    MAINTENANCE_INTERVAL_SECONDS   : int = Field(default=300, description="Seconds between maintenance runs")
+    TOKEN_PURGE_BATCH_SIZE         : int = Field(default=1000, description="Expired refresh tokens deleted per transaction")
+    LOGIN_ATTEMPT_RETENTION_DAYS   : int = Field(default=90, description="Login attempt partitions older than this are dropped")
+    LOGIN_ATTEMPT_PARTITIONS_AHEAD : int = Field(default=2, description="Future monthly login attempt partitions kept ready")
+
+    # Admission Control
+    ADMISSION_CONTROL_ENABLED     : bool = Field(default=True, description="Limit concurrent requests per route group")
+    ADMISSION_AUTH_CONCURRENCY    : int = Field(default=8, description="Concurrent /auths requests")
+    ADMISSION_AUTH_QUEUE_SIZE     : int = Field(default=64, description="/auths requests allowed to wait for admission")
+    ADMISSION_USERS_CONCURRENCY   : int = Field(default=16, description="Concurrent /users requests")
+    ADMISSION_USERS_QUEUE_SIZE    : int = Field(default=128, description="/users requests allowed to wait for admission")
+    ADMISSION_QUEUE_TIMEOUT_MS    : int = Field(default=2000, description="Longest a request waits for admission before 503")
+    ADMISSION_RETRY_AFTER_SECONDS : int = Field(default=1, description="Retry-After sent with shed requests")
+
+    # Metrics
+    METRICS_ENABLED             : bool = Field(default=True, description="Expose Prometheus metrics on /metrics")
+
     # Logging
     LOG_LEVEL                   : str = Field(default="INFO", description="Log level")
+    LOG_FORMAT                  : str = Field(default="text", description="text, or json for structured lines written by a background thread")
+    LOG_DIR                     : str = Field(default="logs", description="Directory for log files")
+    LOG_RETENTION_DAYS          : int = Field(default=30, description="Days of daily log files kept")
+    LOG_QUEUE_SIZE              : int = Field(default=10000, description="Records buffered for the JSON writer; INFO and below are dropped beyond this")
+    LOG_BATCH_SIZE              : int = Field(default=512, description="Most records the JSON writer renders per write")
+    LOG_SAMPLE_RATE             : float = Field(default=1.0, description="Fraction of INFO-and-below access logs kept")
+    LOG_ROUTE_SAMPLE_RATES      : Dict[str, float] = Field(default={}, description="Per-route sample rates as JSON, e.g. {\"/health\": 0}")
+    ACCESS_LOG_ENABLED          : bool = Field(default=True, description="Log one line per request, replacing uvicorn's access log")
     
     class Config:
         env_file                = ".env"
         env_file_encoding       = "utf-8"
         case_sensitive          = False
 
+    @model_validator(mode="after")
+    def fit_pool_to_connection_budget(self) -> "Settings":
+        # Every worker owns its own pools (two in async mode: the sync engine
+        # still serves exports and the login audit writer), so the per-worker
+        # pool is clamped until the whole deployment fits the budget.
+        if not self.DB_MAX_CONNECTIONS:
+            return self
+        pools       = self.WEB_CONCURRENCY * (2 if self.DB_ASYNC else 1)
+        per_pool    = (self.DB_MAX_CONNECTIONS - self.DB_RESERVED_CONNECTIONS) // pools
+        if per_pool < 1:
+            raise ValueError(
+                f"DB_MAX_CONNECTIONS={self.DB_MAX_CONNECTIONS} cannot give {pools} pools a connection each; "
+                f"lower WEB_CONCURRENCY or raise DB_MAX_CONNECTIONS"
+            )
+        self.DB_POOL_SIZE       = min(self.DB_POOL_SIZE, per_pool)
+        self.DB_MAX_OVERFLOW    = min(self.DB_MAX_OVERFLOW, per_pool - self.DB_POOL_SIZE)
+        return self
+
+    @model_validator(mode="after")
+    def check_user_cache_backend(self) -> "Settings":
+        # Workers cannot invalidate each other's in-process caches, so one
+        # of them would keep serving a user row another has just changed.
+        if self.USER_CACHE_BACKEND == "auto":
+            self.USER_CACHE_BACKEND = "memory" if self.WEB_CONCURRENCY == 1 else "none"
+        elif self.USER_CACHE_BACKEND == "memory" and self.WEB_CONCURRENCY > 1:
+            raise ValueError(
+                f"USER_CACHE_BACKEND=memory cannot be shared by WEB_CONCURRENCY={self.WEB_CONCURRENCY} workers; "
+                f"use redis or none"
+            )
+        return self
+
 
 settings = Settings()
\ No newline at end of file
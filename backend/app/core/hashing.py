@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+from collections import deque
+
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Deque, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.profiling import record_timing
+from app.core.security import hash_password, hash_passwords, verify_password
+
+
+class HashingOverloadedError(Exception):
+    """Raised when the hashing pool already has its maximum amount of work pending."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a dedicated, size-limited pool so CPU-bound hashing never
+    occupies the request threadpool or the event loop. At most
+    ``pool_size + queue_size`` jobs are pending at once; anything beyond that
+    is rejected immediately with ``HashingOverloadedError``.
+
+    Bulk hashing is split into ``chunk_size`` jobs of which at most
+    ``pool_size - 1`` are in the pool at a time; the rest wait in a separate
+    queue. A login verify therefore always finds a worker free, or at worst
+    waits for one chunk, however large the import.
+    """
+
+    def __init__(self, kind: str, pool_size: int, queue_size: int, chunk_size: int = 32):
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown hashing pool kind: {kind}")
+
+        self.kind           = kind
+        self.pool_size      = pool_size
+        self.max_pending    = pool_size + queue_size
+        self.chunk_size     = chunk_size
+        self.bulk_slots     = max(1, pool_size - 1)
+        self._executor      : Optional[Executor] = None
+        self._lock          = threading.Lock()
+        self._pending       = 0
+        self._bulk_running  = 0
+        self._bulk_queue    : Deque[Tuple[List[str], Future]] = deque()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.pool_size)
+                    else:
+                        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="hasher")
+        return self._executor
+
+    def _release(self, _future: Future = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HashingOverloadedError()
+            self._pending += 1
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(self._release)
+        return future
+
+    async def _run(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self._submit(fn, *args))
+        finally:
+            record_timing("hash", time.perf_counter() - started)
+
+    def _run_sync(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            return self._submit(fn, *args).result()
+        finally:
+            record_timing("hash", time.perf_counter() - started)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def hash_sync(self, password: str) -> str:
+        return self._run_sync(hash_password, password)
+
+    def verify_sync(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run_sync(verify_password, plain_password, hashed_password)
+
+    def _chunks(self, passwords: List[str]) -> List[List[str]]:
+        return [passwords[i:i + self.chunk_size] for i in range(0, len(passwords), self.chunk_size)]
+
+    def _submit_bulk(self, chunks: List[List[str]]) -> List[Future]:
+        futures = [Future() for _ in chunks]
+        with self._lock:
+            self._bulk_queue.extend(zip(chunks, futures))
+        self._dispatch_bulk()
+        return futures
+
+    def _dispatch_bulk(self) -> None:
+        while True:
+            with self._lock:
+                if self._bulk_running >= self.bulk_slots or not self._bulk_queue:
+                    return
+                chunk, future = self._bulk_queue.popleft()
+                # Skips chunks whose caller went away (cancelled hash_many).
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._bulk_running += 1
+
+            try:
+                job = self._get_executor().submit(hash_passwords, chunk)
+            except BaseException as e:
+                self._finish_bulk(future, None, e)
+                continue
+            job.add_done_callback(lambda job, future=future: self._finish_bulk(future, job))
+
+    def _finish_bulk(self, future: Future, job: Optional[Future], error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._bulk_running -= 1
+        if job is not None:
+            error = CancelledError() if job.cancelled() else job.exception()
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(job.result())
+        self._dispatch_bulk()
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        if not passwords:
+            return []
+        started = time.perf_counter()
+        try:
+            results = await asyncio.gather(*(asyncio.wrap_future(future) for future in self._submit_bulk(self._chunks(passwords))))
+            return [hashed for chunk in results for hashed in chunk]
+        finally:
+            record_timing("hash", time.perf_counter() - started)
+
+    def hash_many_sync(self, passwords: List[str]) -> List[str]:
+        if not passwords:
+            return []
+        started = time.perf_counter()
+        futures = self._submit_bulk(self._chunks(passwords))
+        try:
+            return [hashed for future in futures for hashed in future.result()]
+        finally:
+            for future in futures:
+                future.cancel()
+            record_timing("hash", time.perf_counter() - started)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            queued, self._bulk_queue = self._bulk_queue, deque()
+        for _chunk, future in queued:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    kind        = settings.HASH_POOL_KIND,
+    pool_size   = settings.HASH_POOL_SIZE,
+    queue_size  = settings.HASH_QUEUE_SIZE,
+    chunk_size  = settings.HASH_BULK_CHUNK_SIZE
+)
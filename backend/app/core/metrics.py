@@ -0,0 +1,130 @@
+import os
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# With several uvicorn/gunicorn workers, set PROMETHEUS_MULTIPROC_DIR to a
+# shared, empty directory before start-up: every worker then writes its samples
+# to mmap-ed files there and a scrape of any worker aggregates all of them.
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUEST_COUNT       = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"]
+)
+REQUEST_LATENCY     = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets = LATENCY_BUCKETS
+)
+REQUESTS_IN_FLIGHT  = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    multiprocess_mode = "livesum"
+)
+DB_POOL_SIZE        = Gauge(
+    "db_pool_size",
+    "Configured connection pool size",
+    ["pool"],
+    multiprocess_mode = "livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode = "livesum"
+)
+DB_POOL_OVERFLOW    = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is still filling)",
+    ["pool"],
+    multiprocess_mode = "livesum"
+)
+DB_POOL_WAIT        = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    ["pool"],
+    buckets = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+)
+
+ADMISSION_IN_FLIGHT     = Gauge(
+    "admission_in_flight",
+    "Requests admitted and running, per route group",
+    ["group"],
+    multiprocess_mode = "livesum"
+)
+ADMISSION_QUEUE_DEPTH   = Gauge(
+    "admission_queue_depth",
+    "Requests waiting for admission, per route group",
+    ["group"],
+    multiprocess_mode = "livesum"
+)
+ADMISSION_SHED          = Counter(
+    "admission_shed_total",
+    "Requests rejected with 503 by admission control, per route group",
+    ["group"]
+)
+
+SINGLEFLIGHT_CALLS      = Counter(
+    "singleflight_calls_total",
+    "Calls through a single-flight group: executed ran the fetch, coalesced shared another caller's",
+    ["name", "outcome"]
+)
+
+CACHE_REQUESTS          = Counter(
+    "cache_requests_total",
+    "Cache reads per cache and result (hit or miss)",
+    ["cache", "result"]
+)
+CACHE_EVICTIONS         = Counter(
+    "cache_evictions_total",
+    "Entries evicted from an in-process cache to stay within its size bound",
+    ["cache"]
+)
+
+# First samples of the installed pools, taken by sample_pool_metrics().
+_pool_samplers = []
+
+def install_pool_metrics(engine: Engine, name: str) -> None:
+    """
+    Keep the pool gauges for ``engine`` current on every checkout and
+    checkin. Nothing is sampled here: engines are created at import, which
+    with a preloaded gunicorn app happens in the master, and a livesum gauge
+    written there would never be marked dead.
+    """
+    engine.pool.metrics_name = name
+
+    def _update(*_args) -> None:
+        # engine.pool is replaced on dispose(), so always read the current one.
+        pool = engine.pool
+        DB_POOL_SIZE.labels(name).set(pool.size())
+        DB_POOL_CHECKED_OUT.labels(name).set(pool.checkedout())
+        DB_POOL_OVERFLOW.labels(name).set(pool.overflow())
+
+    event.listen(engine, "checkout", _update)
+    event.listen(engine, "checkin", _update)
+    _pool_samplers.append(_update)
+
+def sample_pool_metrics() -> None:
+    """Publish the initial pool gauges; call once in each serving process."""
+    for update in _pool_samplers:
+        update()
+
+def render_metrics() -> bytes:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+def mark_worker_dead(pid: int) -> None:
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
+
+__all__ = ["CONTENT_TYPE_LATEST", "install_pool_metrics", "sample_pool_metrics", "render_metrics", "mark_worker_dead"]
@@ -0,0 +1,76 @@
+import heapq
+import time
+
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class RequestProfile:
+    """Per-request accumulator for SQL statements and named timing segments."""
+
+    __slots__ = ("started", "query_count", "db_time", "timings", "max_statements", "_slowest")
+
+    def __init__(self, max_statements: int):
+        self.started        = time.perf_counter()
+        self.query_count    = 0
+        self.db_time        = 0.0
+        self.timings        : Dict[str, float] = {}
+        self.max_statements = max_statements
+        self._slowest       : List[Tuple[float, str]] = []
+
+    def record_statement(self, statement: str, duration: float) -> None:
+        self.query_count    += 1
+        self.db_time        += duration
+        if self.max_statements <= 0:
+            return
+        if len(self._slowest) < self.max_statements:
+            heapq.heappush(self._slowest, (duration, statement))
+        elif duration > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (duration, statement))
+
+    def add_timing(self, name: str, duration: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + duration
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def slowest_statements(self) -> List[Tuple[float, str]]:
+        return sorted(self._slowest, reverse=True)
+
+    def server_timing(self, with_timings: bool = True) -> str:
+        parts = [
+            f"app;dur={self.elapsed() * 1000:.2f}",
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.query_count} queries"',
+        ]
+        if with_timings:
+            parts.extend(f"{name};dur={duration * 1000:.2f}" for name, duration in self.timings.items())
+        return ", ".join(parts)
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+def current_profile() -> Optional[RequestProfile]:
+    return _current_profile.get()
+
+def record_timing(name: str, duration: float) -> None:
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.add_timing(name, duration)
+
+def install_query_profiler(engine: Engine) -> None:
+    """Attach cursor-execute listeners that report statement timings to the active request profile."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_profile.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        profile = _current_profile.get()
+        started = conn.info.get("query_started")
+        if profile is not None and started:
+            profile.record_statement(statement, time.perf_counter() - started.pop())
@@ -0,0 +1,163 @@
+import math
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Optional
+
+from app.core.config import settings
+
+
+class LoginThrottledError(Exception):
+    """Raised when a login is rejected by the throttle; surfaced to clients as 429."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Too many login attempts")
+        self.retry_after = retry_after
+
+
+class SlidingWindowLimiter:
+    """
+    In-process sliding-window counter. Each key keeps only the counts of the
+    current and previous fixed windows and estimates the sliding count as
+    ``previous * (1 - elapsed_fraction) + current``, so every update is O(1).
+    At most ``max_keys`` keys are tracked; the least recently seen key is
+    evicted first.
+    """
+
+    def __init__(self, limit: int, window_seconds: float, max_keys: int):
+        self.limit      = limit
+        self.window     = window_seconds
+        self.max_keys   = max_keys
+        self._entries   : "OrderedDict[str, list]" = OrderedDict()
+        self._lock      = threading.Lock()
+
+    def hit(self, key: str, now: Optional[float] = None) -> float:
+        """Count one attempt for ``key``; return 0 if allowed, else seconds until retry."""
+        now             = time.time() if now is None else now
+        window_index    = int(now // self.window)
+        elapsed         = (now % self.window) / self.window
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [window_index, 0, 0]
+                self._entries[key] = entry
+                if len(self._entries) > self.max_keys:
+                    self._entries.popitem(last=False)
+            elif entry[0] != window_index:
+                previous    = entry[2] if entry[0] == window_index - 1 else 0
+                entry[:]    = [window_index, previous, 0]
+            self._entries.move_to_end(key)
+
+            if entry[1] * (1 - elapsed) + entry[2] >= self.limit:
+                return self.window * (1 - elapsed)
+
+            entry[2] += 1
+            return 0.0
+
+    async def ahit(self, key: str, now: Optional[float] = None) -> float:
+        # In-process and O(1): nothing to await.
+        return self.hit(key, now)
+
+
+# Check and increment in one round trip, atomically: with a separate read
+# and INCR, concurrent workers could all pass the check before any
+# increment landed. Returns 1 if the attempt was counted, 0 if over limit.
+SLIDING_WINDOW_HIT = """
+local previous  = tonumber(redis.call('GET', KEYS[1]) or '0')
+local current   = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[1]) + current >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return 1
+"""
+
+
+class RedisSlidingWindowLimiter:
+    """
+    Same estimate as ``SlidingWindowLimiter`` but with the per-window counters
+    kept in Redis, so the limit is shared by every worker and instance. The
+    check and increment run as one Lua script. ``ahit`` uses ``async_client``
+    (a ``redis.asyncio.Redis``) so the async stack does not block on Redis.
+    """
+
+    def __init__(self, client, limit: int, window_seconds: float, prefix: str, async_client=None):
+        self.client         = client
+        self.async_client   = async_client
+        self.limit          = limit
+        self.window         = window_seconds
+        self.prefix         = prefix
+        self._script        = client.register_script(SLIDING_WINDOW_HIT)
+        self._async_script  = async_client.register_script(SLIDING_WINDOW_HIT) if async_client is not None else None
+
+    def hit(self, key: str, now: Optional[float] = None) -> float:
+        keys, args, retry_after = self._script_call(key, now)
+        return 0.0 if self._script(keys=keys, args=args) else retry_after
+
+    async def ahit(self, key: str, now: Optional[float] = None) -> float:
+        keys, args, retry_after = self._script_call(key, now)
+        return 0.0 if await self._async_script(keys=keys, args=args) else retry_after
+
+    def _script_call(self, key: str, now: Optional[float]):
+        now             = time.time() if now is None else now
+        window_index    = int(now // self.window)
+        elapsed         = (now % self.window) / self.window
+        keys            = [f"{self.prefix}{key}:{window_index - 1}", f"{self.prefix}{key}:{window_index}"]
+        args            = [repr(1 - elapsed), self.limit, math.ceil(self.window * 2)]
+        return keys, args, self.window * (1 - elapsed)
+
+
+class LoginThrottle:
+    """Per-IP and per-email limits checked before any database or bcrypt work."""
+
+    def __init__(self, ip_limiter, email_limiter, enabled: bool = True):
+        self.ip_limiter     = ip_limiter
+        self.email_limiter  = email_limiter
+        self.enabled        = enabled
+        self.rejected       = 0
+
+    def check(self, email: str, ip_address: str) -> None:
+        if not self.enabled:
+            return
+
+        self._raise_if_limited(self.ip_limiter.hit(ip_address) or self.email_limiter.hit(email.lower()))
+
+    async def acheck(self, email: str, ip_address: str) -> None:
+        if not self.enabled:
+            return
+
+        self._raise_if_limited(await self.ip_limiter.ahit(ip_address) or await self.email_limiter.ahit(email.lower()))
+
+    def _raise_if_limited(self, retry_after: float) -> None:
+        if retry_after:
+            self.rejected += 1
+            raise LoginThrottledError(retry_after)
+
+
+def _create_limiter(limit: int, prefix: str):
+    if settings.LOGIN_THROTTLE_BACKEND == "redis":
+        import redis
+        import redis.asyncio
+
+        return RedisSlidingWindowLimiter(
+            redis.Redis.from_url(settings.REDIS_URL),
+            limit           = limit,
+            window_seconds  = settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+            prefix          = prefix,
+            async_client    = redis.asyncio.Redis.from_url(settings.REDIS_URL)
+        )
+    return SlidingWindowLimiter(
+        limit           = limit,
+        window_seconds  = settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+        max_keys        = settings.LOGIN_THROTTLE_MAX_KEYS
+    )
+
+
+login_throttle = LoginThrottle(
+    ip_limiter      = _create_limiter(settings.LOGIN_THROTTLE_IP_LIMIT, "throttle:login:ip:"),
+    email_limiter   = _create_limiter(settings.LOGIN_THROTTLE_EMAIL_LIMIT, "throttle:login:email:"),
+    enabled         = settings.LOGIN_THROTTLE_ENABLED
+)
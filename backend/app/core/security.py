@@ -1,29 +1,67 @@
-from passlib.context import CryptContext
-from jose import JWTError, jwt
 from datetime import datetime, timedelta
+from functools import lru_cache
 from app.core.config import settings
+from app.core.cache import MemoryCache
+from typing import List, Optional
+import hashlib
 import secrets
+import time
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib and jose (with its crypto backend) are imported on first use rather
+# than at startup; see benchmarks/bench_cold_start.py.
+@lru_cache(maxsize=None)
+def _pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# Verified access-token claims, each kept until its token's own exp.
+_claims_cache = MemoryCache(max_size=settings.ACCESS_TOKEN_CACHE_SIZE, ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, name="access_token")
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    return [_pwd_context().hash(password) for password in passwords]
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 def create_access_token(data: dict) -> str:
     to_encode       = data.copy()
     expire          = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    # jti identifies this token for revocation on logout.
+    to_encode.update({"exp": expire, "jti": secrets.token_hex(16)})
+    from jose import jwt
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 def create_refresh_token() -> str:
     return secrets.token_urlsafe(32)
 
+def hash_refresh_token(token: str) -> str:
+    # Refresh tokens are stored as fixed-width SHA-256 hex digests, never raw.
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def verify_token(token: str) -> dict:
+    from jose import JWTError, jwt
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
-        return {}
\ No newline at end of file
+        return {}
+
+def decode_access_token(token: str) -> Optional[dict]:
+    """Verify an access token, serving repeat tokens from an LRU of decoded claims."""
+    claims = _claims_cache.get(token)
+    if claims is not None:
+        return claims
+
+    claims = verify_token(token)
+    if not claims or "exp" not in claims:
+        return None
+
+    ttl = claims["exp"] - time.time()
+    if ttl <= 0:
+        return None
+
+    _claims_cache.set(token, claims, ttl=ttl)
+    return claims
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from app.database import engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    pass
+
+
+def verify_migration_head() -> None:
+    """
+    Fail fast unless the database is at the newest migration. Costs one
+    ``SELECT`` on alembic_version, where create_all reflected every table.
+    """
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    expected = set(ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_heads())
+    with engine.connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+
+    if current != expected:
+        raise SchemaOutOfDateError(
+            f"Database is at revision {sorted(current) or 'none'}, code expects {sorted(expected)}; run `alembic upgrade head`"
+        )
@@ -1,5 +1,5 @@
 from .base import Base
 from .user_model import User
-from .auth_model import RefreshToken, LoginAttempt
+from .auth_model import RefreshToken, RevokedToken, LoginAttempt, LoginAttemptHourlyByEmail, LoginAttemptHourlyByIp
 
-__all__ = ["Base", "User", "RefreshToken", "LoginAttempt"]
\ No newline at end of file
+__all__ = ["Base", "User", "RefreshToken", "RevokedToken", "LoginAttempt", "LoginAttemptHourlyByEmail", "LoginAttemptHourlyByIp"]
\ No newline at end of file
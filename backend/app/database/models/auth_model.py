@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey, func
+from sqlalchemy import String, DateTime, ForeignKey, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database.models.base import Base
 from datetime import datetime
@@ -7,18 +7,46 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
     
     id          : Mapped[int]           = mapped_column(primary_key=True, index=True)
-    token       : Mapped[str]           = mapped_column(String(500), unique=True, index=True)
-    user_id     : Mapped[int]           = mapped_column(ForeignKey("users.id"))
-    expires_at  : Mapped[datetime]      = mapped_column(DateTime(timezone=True))
+    token       : Mapped[str]           = mapped_column(String(64), unique=True, index=True)  # SHA-256 hex digest
+    user_id     : Mapped[int]           = mapped_column(ForeignKey("users.id"), index=True)
+    expires_at  : Mapped[datetime]      = mapped_column(DateTime(timezone=True), index=True)
     created_at  : Mapped[datetime]      = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     user        : Mapped["User"]        = relationship("User", back_populates="refresh_tokens")
 
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+    
+    jti         : Mapped[str]           = mapped_column(String(64), primary_key=True)
+    expires_at  : Mapped[datetime]      = mapped_column(DateTime(timezone=True), index=True)  # the revoked token's own exp
+    revoked_at  : Mapped[datetime]      = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+
 class LoginAttempt(Base):
     __tablename__ = "login_attempts"
+    # Monthly range partitions (login_attempts_yYYYYmMM), managed by
+    # MaintenanceService; retention drops whole partitions.
+    __table_args__ = {"postgresql_partition_by": "RANGE (attempted_at)"}
     
-    id          : Mapped[int]           = mapped_column(primary_key=True, index=True)
+    id          : Mapped[int]           = mapped_column(primary_key=True, autoincrement=True)
     email       : Mapped[str]           = mapped_column(String(255), index=True)
     ip_address  : Mapped[str]           = mapped_column(String(45))
     success     : Mapped[bool]          = mapped_column()
-    attempted_at: Mapped[datetime]      = mapped_column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    attempted_at: Mapped[datetime]      = mapped_column(DateTime(timezone=True), server_default=func.now(), primary_key=True, index=True)
+
+# Hourly rollups of login_attempts, maintained by LoginAttemptWriter in the
+# same transaction as the raw rows. They outlive raw partition retention.
+class LoginAttemptHourlyByEmail(Base):
+    __tablename__ = "login_attempt_hourly_by_email"
+    
+    bucket      : Mapped[datetime]      = mapped_column(DateTime(timezone=True), primary_key=True)
+    email       : Mapped[str]           = mapped_column(String(255), primary_key=True, index=True)
+    successes   : Mapped[int]           = mapped_column(Integer, default=0)
+    failures    : Mapped[int]           = mapped_column(Integer, default=0)
+
+class LoginAttemptHourlyByIp(Base):
+    __tablename__ = "login_attempt_hourly_by_ip"
+    
+    bucket      : Mapped[datetime]      = mapped_column(DateTime(timezone=True), primary_key=True)
+    ip_address  : Mapped[str]           = mapped_column(String(45), primary_key=True, index=True)
+    successes   : Mapped[int]           = mapped_column(Integer, default=0)
+    failures    : Mapped[int]           = mapped_column(Integer, default=0)
@@ -6,6 +6,8 @@ from typing import List
 
 class User(Base):
     __tablename__ = "users"
+    # Search indexes on lower(username)/lower(email) are expression indexes
+    # created by migration 0003; see UserSearchService.
     
     id          : Mapped[int]           = mapped_column(primary_key=True, index=True)
     email       : Mapped[str]           = mapped_column(String(255), unique=True, index=True)
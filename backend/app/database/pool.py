@@ -0,0 +1,34 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import DB_POOL_WAIT
+from app.core.profiling import record_timing
+
+
+class _TimedCheckoutMixin:
+    """Measures how long ``connect()`` waits for a pooled connection."""
+
+    metrics_name = "primary"
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            waited = time.perf_counter() - started
+            DB_POOL_WAIT.labels(self.metrics_name).observe(waited)
+            record_timing("pool", waited)
+
+    def recreate(self):
+        pool                = super().recreate()
+        pool.metrics_name   = self.metrics_name
+        return pool
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
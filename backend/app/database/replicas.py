@@ -0,0 +1,80 @@
+import itertools
+import threading
+import time
+
+from typing import Iterator, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.core.metrics import install_pool_metrics
+from app.core.profiling import install_query_profiler
+from app.database.pool import TimedQueuePool, TimedAsyncAdaptedQueuePool
+
+
+class ReplicaSet:
+    """
+    Sync and async engines for each read replica, handed out round-robin.
+    A replica that fails to provide a connection is skipped for
+    ``retry_seconds`` before it is tried again.
+    """
+
+    def __init__(self, urls: List[str], retry_seconds: float, engine_options: dict):
+        self.retry_seconds      = retry_seconds
+        self.engines            = []
+        self.async_engines      = []
+        self.sessionmakers      = []
+        self.async_sessionmakers= []
+        self._unhealthy_until   = [0.0] * len(urls)
+        self._counter           = itertools.count()
+        self._lock              = threading.Lock()
+
+        for index, url in enumerate(urls):
+            sync_url    = make_url(url).set(drivername="postgresql+psycopg2")
+            async_url   = make_url(url).set(drivername="postgresql+asyncpg")
+
+            engine          = create_engine(sync_url, poolclass=TimedQueuePool, **engine_options)
+            async_engine    = create_async_engine(async_url, poolclass=TimedAsyncAdaptedQueuePool, **engine_options)
+            for name, instrumented in ((f"replica{index}", engine), (f"replica{index}_async", async_engine.sync_engine)):
+                install_query_profiler(instrumented)
+                install_pool_metrics(instrumented, name)
+
+            self.engines.append(engine)
+            self.async_engines.append(async_engine)
+            self.sessionmakers.append(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+            self.async_sessionmakers.append(async_sessionmaker(autoflush=False, expire_on_commit=False, bind=async_engine))
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def candidates(self) -> Iterator[int]:
+        """Healthy replica indexes, starting from the next one in round-robin order."""
+        count = len(self.engines)
+        if not count:
+            return
+        start   = next(self._counter) % count
+        now     = time.monotonic()
+        for offset in range(count):
+            index = (start + offset) % count
+            if self._unhealthy_until[index] <= now:
+                yield index
+
+    def mark_unhealthy(self, index: int) -> None:
+        with self._lock:
+            self._unhealthy_until[index] = time.monotonic() + self.retry_seconds
+
+    def dispose(self) -> None:
+        for engine in self.engines:
+            engine.dispose()
+
+    def reset_after_fork(self) -> None:
+        for engine in self.engines:
+            engine.dispose(close=False)
+        for engine in self.async_engines:
+            engine.sync_engine.dispose(close=False)
+
+    async def dispose_async(self) -> None:
+        for engine in self.async_engines:
+            await engine.dispose()
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 
 class LoginRequest(BaseModel):
     email       : EmailStr
@@ -12,6 +12,10 @@ class TokenResponse(BaseModel):
     token_type      : str = "bearer"
     expires_in      : int
 
+class CurrentUser(BaseModel):
+    id          : int
+    expires_at  : datetime
+
 class RefreshTokenRequest(BaseModel):
     refresh_token   : str
 
@@ -33,4 +37,16 @@ class LoginAttemptResponse(BaseModel):
     attempted_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class LoginStatsBucket(BaseModel):
+    bucket      : datetime
+    successes   : int
+    failures    : int
+    failure_rate: float
+
+class LoginStatsResponse(BaseModel):
+    buckets     : List[LoginStatsBucket]
+    successes   : int
+    failures    : int
+    failure_rate: float
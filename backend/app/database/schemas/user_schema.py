@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 
 class UserBase(BaseModel):
     email       : EmailStr
@@ -24,5 +24,40 @@ class UserResponse(UserBase):
     class Config:
         from_attributes = True
 
+class UserSearchResult(UserResponse):
+    score       : float
+
 class UserInDB(UserResponse):
-    hashed_password : str
\ No newline at end of file
+    hashed_password : str
+
+class BulkUserCreate(UserBase):
+    # Either a plain password, or an existing bcrypt hash carried over from a legacy system.
+    password        : Optional[str] = Field(None, min_length=8)
+    hashed_password : Optional[str] = Field(None, pattern=r"^\$2[aby]?\$\d{2}\$.{53}$")
+
+    @model_validator(mode="after")
+    def check_password(self) -> "BulkUserCreate":
+        if (self.password is None) == (self.hashed_password is None):
+            raise ValueError("Provide exactly one of password or hashed_password")
+        return self
+
+class BulkUserCreated(BaseModel):
+    index       : int
+    id          : int
+
+class BulkUserConflict(BaseModel):
+    index       : int
+    email       : str
+    username    : str
+    detail      : str = "Email or username already exists"
+
+class BulkUserCreateResponse(BaseModel):
+    created     : List[BulkUserCreated]
+    conflicts   : List[BulkUserConflict]
+
+class BulkUserUpdate(UserUpdate):
+    id          : int
+
+class BulkUserUpdateResponse(BaseModel):
+    updated     : List[int]
+    not_found   : List[int]
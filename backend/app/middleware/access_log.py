@@ -0,0 +1,48 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger, color_status_code
+from app.middleware.routing import route_template
+
+
+class AccessLogMiddleware:
+    """
+    One log line per request, bound with ``route``, ``method``, ``status`` and
+    ``duration_ms`` so JSON logs carry them as fields. The route template is
+    what LOG_ROUTE_SAMPLE_RATES matches; 5xx responses are logged at WARNING
+    so sampling never drops them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            path        = scope["path"].replace("<", r"\<")
+            logger.bind(
+                route       = route_template(scope),
+                method      = scope["method"],
+                path        = scope["path"],
+                status      = status_code,
+                duration_ms = duration_ms
+            ).opt(colors=True).log(
+                "WARNING" if status_code >= 500 else "INFO",
+                f"{scope['method']} {path} {color_status_code(status_code)} {duration_ms}ms"
+            )
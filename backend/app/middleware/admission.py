@@ -0,0 +1,116 @@
+import asyncio
+
+from typing import Dict, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_SHED
+
+
+class AdmissionGroup:
+    """
+    Concurrency limit with a bounded wait queue for one group of routes.
+    Requests beyond ``concurrency`` wait up to ``queue_timeout`` seconds; if
+    ``queue_size`` requests are already waiting, or the deadline passes, the
+    request is shed.
+    """
+
+    def __init__(self, name: str, concurrency: int, queue_size: int, queue_timeout: float):
+        self.name           = name
+        self.queue_size     = queue_size
+        self.queue_timeout  = queue_timeout
+        self.waiting        = 0
+        self.shed           = 0
+        self._semaphore     = asyncio.Semaphore(concurrency)
+
+    async def acquire(self) -> bool:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            ADMISSION_IN_FLIGHT.labels(self.name).inc()
+            return True
+
+        if self.waiting >= self.queue_size:
+            return self._reject()
+
+        self.waiting += 1
+        ADMISSION_QUEUE_DEPTH.labels(self.name).inc()
+        acquired = False
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await self._semaphore.acquire()
+                acquired = True
+        except BaseException as e:
+            # A deadline or cancellation landing right after the acquire must not leak the slot.
+            if acquired:
+                self._semaphore.release()
+            if not isinstance(e, TimeoutError):
+                raise
+            return self._reject()
+        finally:
+            self.waiting -= 1
+            ADMISSION_QUEUE_DEPTH.labels(self.name).dec()
+
+        ADMISSION_IN_FLIGHT.labels(self.name).inc()
+        return True
+
+    def release(self) -> None:
+        ADMISSION_IN_FLIGHT.labels(self.name).dec()
+        self._semaphore.release()
+
+    def _reject(self) -> bool:
+        self.shed += 1
+        ADMISSION_SHED.labels(self.name).inc()
+        return False
+
+
+class AdmissionControlMiddleware:
+    """
+    Applies an ``AdmissionGroup`` per path prefix and answers shed requests
+    with 503 + Retry-After. The slot is given back once the response starts,
+    so a long streaming body (such as ``/users/export``) does not hold it.
+    """
+
+    def __init__(self, app: ASGIApp, groups: Dict[str, AdmissionGroup], retry_after_seconds: int):
+        self.app            = app
+        self.groups         = groups
+        self.retry_after    = str(retry_after_seconds)
+
+    def _group_for(self, path: str) -> Optional[AdmissionGroup]:
+        for prefix, group in self.groups.items():
+            if path.startswith(prefix):
+                return group
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        group = self._group_for(scope["path"]) if scope["type"] == "http" else None
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await group.acquire():
+            response = JSONResponse(
+                status_code = 503,
+                content     = {"detail": "Server is busy, please retry shortly"},
+                headers     = {"Retry-After": self.retry_after}
+            )
+            await response(scope, receive, send)
+            return
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                group.release()
+
+        async def send_releasing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_releasing)
+        finally:
+            release()
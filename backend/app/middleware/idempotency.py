@@ -0,0 +1,196 @@
+import asyncio
+import base64
+import hashlib
+
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+IDEMPOTENCY_HEADER  = "idempotency-key"
+REPLAYED_HEADER     = b"idempotent-replayed"
+MAX_KEY_LENGTH      = 255
+PENDING             = "pending"
+
+# Error responses that repeat for the same request. Anything else outside
+# 2xx (throttling, conflicts, timeouts, unavailability) may succeed on retry,
+# so it is not kept.
+REPLAYABLE_ERRORS   = frozenset({400, 401, 404, 422})
+
+
+class IdempotencyMiddleware:
+    """
+    Makes POST requests carrying an ``Idempotency-Key`` header safe to retry.
+
+    The first request with a key runs; its status, headers and body are kept
+    in ``store`` (any ``app.core.cache`` backend, used through its async
+    methods so Redis never blocks the event loop) for the store's TTL and
+    replayed for later requests with the same key. Duplicates arriving while
+    the first is still running wait for it in-process; another worker's
+    in-flight request is reported as 409, which needs a store shared by all
+    workers (Redis). A key reused with a different
+    method, path, body or Authorization header is rejected with 422.
+    Only 2xx and deterministic 4xx responses (``REPLAYABLE_ERRORS``) are
+    kept; 408, 409, 429, 5xx and bodies over ``max_response_bytes`` are not,
+    so the client can retry them. Requests to ``excluded_paths`` (the
+    token-issuing routes, whose responses carry credentials) bypass it.
+    """
+
+    def __init__(
+        self,
+        app                 : ASGIApp,
+        store,
+        lock_seconds        : int,
+        max_body_bytes      : int,
+        max_response_bytes  : int,
+        excluded_paths      : Sequence[str] = ()
+    ):
+        self.app                = app
+        self.store              = store
+        self.lock_seconds       = lock_seconds
+        self.max_body_bytes     = max_body_bytes
+        self.max_response_bytes = max_response_bytes
+        self.excluded_paths     = frozenset(excluded_paths)
+        self._inflight          : Dict[str, asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers     = Headers(scope=scope)
+        client_key  = headers.get(IDEMPOTENCY_HEADER)
+        if client_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not client_key or len(client_key) > MAX_KEY_LENGTH:
+            await self._error(scope, receive, send, 400, f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters")
+            return
+
+        body, receive = await self._buffer_body(receive)
+        if body is None:
+            # Too large to fingerprint cheaply; served without idempotency.
+            await self.app(scope, receive, send)
+            return
+
+        key         = f"{scope['path']}:{client_key}"
+        fingerprint = self._fingerprint(scope, headers, body)
+
+        while True:
+            leader = self._inflight.get(key)
+            if leader is not None:
+                record = await asyncio.shield(leader)
+                if record is None:
+                    continue
+                await self._replay_or_reject(record, fingerprint, scope, receive, send)
+                return
+
+            record = await self.store.aget(key)
+            if record is not None:
+                if record.get("state") == PENDING:
+                    await self._error(scope, receive, send, 409, "A request with this Idempotency-Key is in progress", retry_after=1)
+                    return
+                await self._replay_or_reject(record, fingerprint, scope, receive, send)
+                return
+
+            if await self.store.aadd(key, {"state": PENDING, "fingerprint": fingerprint}, ttl=self.lock_seconds):
+                break
+
+        await self._execute(key, fingerprint, scope, receive, send)
+
+    async def _execute(self, key: str, fingerprint: str, scope: Scope, receive: Receive, send: Send) -> None:
+        future              = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        start               : Optional[Message] = None
+        chunks              : List[bytes] = []
+        size                = 0
+        record              = None
+
+        async def capture(message: Message) -> None:
+            nonlocal start, size
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if size <= self.max_response_bytes:
+                    chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+            if start is not None and size <= self.max_response_bytes:
+                record = {
+                    "fingerprint"   : fingerprint,
+                    "status"        : start["status"],
+                    "headers"       : [[name.decode("latin-1"), value.decode("latin-1")] for name, value in start.get("headers", [])],
+                    "body"          : base64.b64encode(b"".join(chunks)).decode()
+                }
+        finally:
+            try:
+                if record is not None and self._replayable(record["status"]):
+                    await self.store.aset(key, record)
+                else:
+                    await self.store.adelete(key)
+            finally:
+                # Release waiters even if the store call failed or was cancelled.
+                del self._inflight[key]
+                future.set_result(record)
+
+    async def _replay_or_reject(self, record: dict, fingerprint: str, scope: Scope, receive: Receive, send: Send) -> None:
+        if record["fingerprint"] != fingerprint:
+            await self._error(scope, receive, send, 422, "Idempotency-Key was already used for a different request")
+            return
+
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in record["headers"]]
+        headers.append((REPLAYED_HEADER, b"true"))
+        await send({"type": "http.response.start", "status": record["status"], "headers": headers})
+        await send({"type": "http.response.body", "body": base64.b64decode(record["body"])})
+
+    async def _buffer_body(self, receive: Receive):
+        """
+        Read the request body up to ``max_body_bytes`` and return it with a
+        receive that replays the messages read, then continues with the rest
+        of the stream. Past the limit, reading stops and body is None.
+        """
+        messages    : List[Message] = []
+        size        = 0
+        more_body   = True
+        while more_body and size <= self.max_body_bytes:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            size        += len(message.get("body", b""))
+            more_body   = message.get("more_body", False)
+
+        pending = deque(messages)
+
+        async def replay() -> Message:
+            if pending:
+                return pending.popleft()
+            return await receive()
+
+        if size > self.max_body_bytes:
+            return None, replay
+        return b"".join(message.get("body", b"") for message in messages if message["type"] == "http.request"), replay
+
+    @staticmethod
+    def _replayable(status_code: int) -> bool:
+        return 200 <= status_code < 300 or status_code in REPLAYABLE_ERRORS
+
+    @staticmethod
+    def _fingerprint(scope: Scope, headers: Headers, body: bytes) -> str:
+        digest = hashlib.sha256()
+        for part in (scope["method"], scope["path"], scope.get("query_string", b"").decode("latin-1"), headers.get("authorization", "")):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(body)
+        return digest.hexdigest()
+
+    @staticmethod
+    async def _error(scope: Scope, receive: Receive, send: Send, status_code: int, detail: str, retry_after: Optional[int] = None) -> None:
+        headers     = {"Retry-After": str(retry_after)} if retry_after is not None else None
+        response    = JSONResponse(status_code=status_code, content={"detail": detail}, headers=headers)
+        await response(scope, receive, send)
@@ -0,0 +1,58 @@
+from typing import Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger
+from app.core.profiling import RequestProfile, _current_profile
+
+
+class ProfilingMiddleware:
+    """
+    Times each HTTP request, counts its SQL statements and their cumulative
+    duration, and reports them in a ``Server-Timing`` header. Requests slower
+    than ``slow_threshold_ms`` are logged with their slowest statements.
+
+    Under ``private_prefixes`` the header carries only the ``app`` and ``db``
+    segments: a ``hash`` segment on login would tell a caller whether a
+    password was checked, i.e. whether the account exists.
+    """
+
+    def __init__(self, app: ASGIApp, slow_threshold_ms: int, max_statements: int, private_prefixes: Sequence[str] = ()):
+        self.app                = app
+        self.slow_threshold     = slow_threshold_ms / 1000
+        self.max_statements     = max_statements
+        self.private_prefixes   = tuple(private_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(self.max_statements)
+        token   = _current_profile.set(profile)
+        private = scope["path"].startswith(self.private_prefixes)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", profile.server_timing(with_timings=not private))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            elapsed = profile.elapsed()
+            if elapsed >= self.slow_threshold:
+                self._log_slow_request(scope, profile, elapsed)
+
+    def _log_slow_request(self, scope: Scope, profile: RequestProfile, elapsed: float) -> None:
+        timings = ", ".join(f"{name} {duration * 1000:.1f}ms" for name, duration in profile.timings.items())
+        lines   = [
+            f"Slow request {scope['method']} {scope['path']} took {elapsed * 1000:.1f}ms "
+            f"(db {profile.db_time * 1000:.1f}ms over {profile.query_count} queries"
+            + (f", {timings}" if timings else "") + ")"
+        ]
+        for duration, statement in profile.slowest_statements():
+            lines.append(f"  {duration * 1000:.1f}ms  {' '.join(statement.split())[:300]}")
+        logger.warning("\n".join(lines))
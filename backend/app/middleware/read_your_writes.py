@@ -0,0 +1,30 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database import READ_PRIMARY_COOKIE
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware:
+    """
+    After a successful write, sets a short-lived cookie that makes
+    ``get_read_session`` use the primary for that client, so it never reads
+    a replica that has not yet replayed its own change.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: int):
+        self.app    = app
+        self.cookie = f"{READ_PRIMARY_COOKIE}=1; Max-Age={window_seconds}; Path=/; HttpOnly; SameSite=Lax"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                MutableHeaders(scope=message).append("set-cookie", self.cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,30 @@
+from typing import Dict
+
+from starlette.types import Scope
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+_templates: Dict[int, Dict] = {}
+
+def route_template(scope: Scope) -> str:
+    """
+    Return the path template (e.g. ``/api/v1/users/{user_id}``) of the route
+    that handled ``scope``. Must be called after the router has run, since it
+    relies on the ``endpoint`` the router stores in the scope. Using templates
+    instead of raw paths keeps metric and log label cardinality bounded.
+    """
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return UNMATCHED_ROUTE
+
+    app         = scope["app"]
+    templates   = _templates.get(id(app))
+    if templates is None:
+        templates = {
+            route.endpoint: route.path
+            for route in app.routes
+            if hasattr(route, "endpoint")
+        }
+        _templates[id(app)] = templates
+
+    return templates.get(endpoint, UNMATCHED_ROUTE)
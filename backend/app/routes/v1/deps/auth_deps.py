@@ -0,0 +1,88 @@
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.security import decode_access_token
+from app.database import get_read_session, get_async_read_session
+from app.database.models.user_model import User
+from app.database.schemas.auth_schema import CurrentUser
+from app.services.user_service import UserService, AsyncUserService
+from app.services.token_revocation import revocation_list
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code = status.HTTP_401_UNAUTHORIZED,
+        detail      = detail,
+        headers     = {"WWW-Authenticate": "Bearer"}
+    )
+
+async def get_current_user(
+    credentials : Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> CurrentUser:
+    """Principal built from verified token claims alone; no database access."""
+    if credentials is None:
+        raise _unauthorized("Not authenticated")
+
+    claims = decode_access_token(credentials.credentials)
+    if not claims or "sub" not in claims:
+        raise _unauthorized("Invalid or expired token")
+    if revocation_list.is_revoked(claims.get("jti")):
+        raise _unauthorized("Token has been revoked")
+
+    return CurrentUser(
+        id          = int(claims["sub"]),
+        expires_at  = datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+    )
+
+async def get_access_claims(
+    credentials : Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> Optional[dict]:
+    """Verified claims of the bearer token if one was sent, for endpoints where authentication is optional."""
+    return decode_access_token(credentials.credentials) if credentials is not None else None
+
+def get_current_db_user(
+    current_user: CurrentUser   = Depends(get_current_user),
+    db          : Session       = Depends(get_read_session)
+) -> User:
+    """Opt-in variant that also loads the user row and rejects deleted or inactive accounts."""
+    user = UserService.load_user_by_id(db, current_user.id)
+    if not user or not user.is_active:
+        raise _unauthorized("Inactive or unknown user")
+    return user
+
+async def get_current_async_db_user(
+    current_user: CurrentUser   = Depends(get_current_user),
+    db          : AsyncSession  = Depends(get_async_read_session)
+) -> User:
+    user = await AsyncUserService.load_user_by_id(db, current_user.id)
+    if not user or not user.is_active:
+        raise _unauthorized("Inactive or unknown user")
+    return user
+
+def ensure_same_user(current_user: CurrentUser, user_id: int) -> None:
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code = status.HTTP_403_FORBIDDEN,
+            detail      = "Not enough permissions"
+        )
+
+def get_current_superuser(user: User = Depends(get_current_db_user)) -> User:
+    if not user.is_superuser:
+        raise HTTPException(
+            status_code = status.HTTP_403_FORBIDDEN,
+            detail      = "Not enough permissions"
+        )
+    return user
+
+async def get_current_async_superuser(user: User = Depends(get_current_async_db_user)) -> User:
+    if not user.is_superuser:
+        raise HTTPException(
+            status_code = status.HTTP_403_FORBIDDEN,
+            detail      = "Not enough permissions"
+        )
+    return user
@@ -0,0 +1,43 @@
+import json
+
+from fastapi import HTTPException, Request, status
+from pydantic import TypeAdapter, ValidationError
+from typing import List
+
+from app.core.config import settings
+from app.database.schemas.user_schema import BulkUserCreate
+
+_bulk_users_adapter = TypeAdapter(List[BulkUserCreate])
+
+async def get_bulk_user_rows(request: Request) -> List[BulkUserCreate]:
+    """Parse a bulk import body sent as a JSON array or as NDJSON (``application/x-ndjson``)."""
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+            rows = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            rows = json.loads(body)
+    except ValueError:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = "Malformed JSON body"
+        )
+
+    if not isinstance(rows, list):
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = "Expected a JSON array or NDJSON lines"
+        )
+    if len(rows) > settings.BULK_USER_MAX_ROWS:
+        raise HTTPException(
+            status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail      = f"At most {settings.BULK_USER_MAX_ROWS} rows per request"
+        )
+
+    try:
+        return _bulk_users_adapter.validate_python(rows)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail      = e.errors(include_url=False, include_context=False)
+        )
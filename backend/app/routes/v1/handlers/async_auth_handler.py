@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_session, get_async_read_session
+from app.database.models.user_model import User
+from app.services.auth_service import AsyncAuthService
+from app.services.login_stats_service import AsyncLoginStatsService
+from app.database.schemas.auth_schema import LoginRequest, TokenResponse, RefreshTokenRequest, LoginStatsResponse
+from app.routes.v1.deps.auth_deps import get_current_async_superuser, get_access_claims
+from app.utils.stats_range import resolve_stats_range
+from datetime import datetime
+from typing import Optional
+from app.core.config import settings
+from app.utils.serialization import FastJSONResponse
+
+router = APIRouter()
+
+@router.post("/login", response_model=TokenResponse)
+async def login(
+    login_data  : LoginRequest,
+    request     : Request,
+    db          : AsyncSession  = Depends(get_async_session)
+):
+    ip_address      = request.client.host
+    token_response  = await AsyncAuthService.login(
+        db,
+        login_data.email,
+        login_data.password,
+        ip_address
+    )
+
+    if not token_response:
+        raise HTTPException(
+            status_code = status.HTTP_401_UNAUTHORIZED,
+            detail      = "Invalid credentials"
+        )
+
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(token_response.model_dump())
+    return token_response
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(
+    refresh_data: RefreshTokenRequest,
+    db          : AsyncSession  = Depends(get_async_session)
+):
+    token_response          = await AsyncAuthService.refresh_access_token(db, refresh_data.refresh_token)
+
+    if not token_response:
+        raise HTTPException(
+            status_code = status.HTTP_401_UNAUTHORIZED,
+            detail      = "Invalid or expired refresh token"
+        )
+
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(token_response.model_dump())
+    return token_response
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    refresh_data    : RefreshTokenRequest,
+    access_claims   : Optional[dict] = Depends(get_access_claims),
+    db              : AsyncSession = Depends(get_async_session)
+):
+    success = await AsyncAuthService.logout(db, refresh_data.refresh_token, access_claims)
+
+    if not success:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = "Invalid refresh token"
+        )
+
+@router.get("/attempts/stats", response_model=LoginStatsResponse)
+async def login_attempt_stats(
+    email       : Optional[str] = None,
+    ip          : Optional[str] = None,
+    since       : Optional[datetime] = Query(None, description="Defaults to 24 hours before until"),
+    until       : Optional[datetime] = Query(None, description="Defaults to now"),
+    superuser   : User = Depends(get_current_async_superuser),
+    db          : AsyncSession = Depends(get_async_read_session)
+):
+    """Hourly login successes and failures for one email, one IP, or everyone, served from the rollup tables."""
+    if email is not None and ip is not None:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = "Filter by email or ip, not both"
+        )
+    try:
+        since, until = resolve_stats_range(since, until, settings.LOGIN_STATS_MAX_HOURS)
+    except ValueError as e:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = str(e)
+        )
+    return await AsyncLoginStatsService.get_stats(db, since, until, email=email, ip=ip)
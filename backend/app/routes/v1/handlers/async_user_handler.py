@@ -0,0 +1,217 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_session, get_async_read_session
+from app.services.user_service import AsyncUserService, UserAlreadyExistsError, UserVersionMismatchError
+from app.services.user_search_service import AsyncUserSearchService
+from app.database.schemas.user_schema import (
+    UserCreate, UserUpdate, UserResponse, BulkUserCreate, BulkUserCreateResponse,
+    BulkUserUpdate, BulkUserUpdateResponse, UserSearchResult
+)
+from app.database.models.user_model import User
+from app.core.config import settings
+from app.core.enum import ExportFormat
+from app.database.schemas.auth_schema import CurrentUser
+from app.routes.v1.deps.auth_deps import get_current_user, get_current_async_superuser, ensure_same_user
+from app.routes.v1.deps.bulk_deps import get_bulk_user_rows
+from app.utils.etag import user_etag, etag_matches, parse_user_etags
+from app.utils.pagination import encode_cursor, decode_cursor, encode_search_cursor, decode_search_cursor
+from app.utils.serialization import FastJSONResponse, user_to_dict, rows_to_dicts
+from typing import List, Optional
+
+router = APIRouter()
+
+@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def create_user(
+    user_data   : UserCreate,
+    db          : AsyncSession  = Depends(get_async_session)
+):
+    try:
+        return await AsyncUserService.create_user(db, user_data)
+    except UserAlreadyExistsError as e:
+        raise HTTPException(
+            status_code     = status.HTTP_400_BAD_REQUEST,
+            detail          = e.detail
+        )
+
+@router.post("/bulk", response_model=BulkUserCreateResponse)
+async def bulk_create_users(
+    users       : List[BulkUserCreate] = Depends(get_bulk_user_rows),
+    superuser   : User = Depends(get_current_async_superuser),
+    db          : AsyncSession = Depends(get_async_session)
+):
+    """Import users from a JSON array or an NDJSON body; existing emails/usernames are reported as conflicts."""
+    return await AsyncUserService.bulk_create_users(db, users)
+
+@router.patch("/bulk", response_model=BulkUserUpdateResponse)
+async def bulk_update_users(
+    updates     : List[BulkUserUpdate],
+    superuser   : User = Depends(get_current_async_superuser),
+    db          : AsyncSession = Depends(get_async_session)
+):
+    if len(updates) > settings.BULK_USER_MAX_ROWS:
+        raise HTTPException(
+            status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail      = f"At most {settings.BULK_USER_MAX_ROWS} rows per request"
+        )
+
+    try:
+        return await AsyncUserService.bulk_update_users(db, updates)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code = status.HTTP_409_CONFLICT,
+            detail      = "Email or username already taken"
+        )
+
+@router.get("/export")
+async def export_users(
+    fmt         : ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    superuser   : User = Depends(get_current_async_superuser)
+):
+    media_type = "text/csv" if fmt == ExportFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        AsyncUserService.export_users(fmt),
+        media_type  = media_type,
+        headers     = {"Content-Disposition": f"attachment; filename=users.{fmt.value}"}
+    )
+
+@router.get("/search", response_model=List[UserSearchResult])
+async def search_users(
+    response    : Response,
+    q           : str = Query(..., min_length=1, max_length=100),
+    limit       : int = Query(20, ge=1, le=settings.USER_SEARCH_MAX_LIMIT),
+    cursor      : Optional[str] = None,
+    superuser   : User = Depends(get_current_async_superuser),
+    db          : AsyncSession = Depends(get_async_read_session)
+):
+    """Users whose username or email starts with or resembles ``q``, best match first."""
+    after = None
+    if cursor:
+        try:
+            after = decode_search_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail      = "Invalid cursor"
+            )
+
+    results = await AsyncUserSearchService.search_users(db, q, limit=limit, after=after)
+
+    headers = {}
+    if len(results) == limit:
+        headers["X-Next-Cursor"] = encode_search_cursor(results[-1].score, results[-1].id)
+
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(rows_to_dicts(results), headers=headers)
+    response.headers.update(headers)
+    return results
+
+@router.get("/{user_id}", response_model=UserResponse)
+async def get_user(
+    user_id         : int,
+    response        : Response,
+    if_none_match   : Optional[str] = Header(None),
+    db              : AsyncSession = Depends(get_async_read_session)
+):
+    # Revalidation only needs updated_at, answered from the cache or a one-column SELECT.
+    if if_none_match:
+        version = await AsyncUserService.get_user_version(db, user_id)
+        if version is not None:
+            etag = user_etag(user_id, version)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    user = await AsyncUserService.get_user_by_id(db, user_id)
+    if not user:
+        raise HTTPException(
+            status_code     = status.HTTP_404_NOT_FOUND,
+            detail          = "User not found"
+        )
+
+    etag = user_etag(user.id, user.updated_at)
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(user_to_dict(user), headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return user
+
+@router.get("/", response_model=List[UserResponse])
+async def get_users(
+    response: Response,
+    skip    : int = 0,
+    limit   : int = 100,
+    cursor  : Optional[str] = None,
+    db      : AsyncSession = Depends(get_async_read_session)
+):
+    if cursor:
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code = status.HTTP_400_BAD_REQUEST,
+                detail      = "Invalid cursor"
+            )
+        if settings.FAST_SERIALIZATION:
+            users = await AsyncUserService.get_user_rows_after(db, after_id, limit=limit)
+        else:
+            users = await AsyncUserService.get_users_after(db, after_id, limit=limit)
+    elif settings.FAST_SERIALIZATION:
+        users = await AsyncUserService.get_user_rows(db, skip=skip, limit=limit)
+    else:
+        users = await AsyncUserService.get_users(db, skip=skip, limit=limit)
+
+    # A full page means there may be more; hand back an opaque keyset cursor.
+    headers = {}
+    if limit > 0 and len(users) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(users[-1].id)
+
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(rows_to_dicts(users), headers=headers)
+    response.headers.update(headers)
+    return users
+
+@router.put("/{user_id}", response_model=UserResponse)
+async def update_user(
+    user_id     : int,
+    user_data   : UserUpdate,
+    response    : Response,
+    if_match    : Optional[str] = Header(None),
+    current_user: CurrentUser = Depends(get_current_user),
+    db          : AsyncSession = Depends(get_async_session)
+):
+    ensure_same_user(current_user, user_id)
+    expected_versions = parse_user_etags(if_match, user_id) if if_match else None
+    try:
+        user = await AsyncUserService.update_user(db, user_id, user_data, expected_versions)
+    except UserAlreadyExistsError as e:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = e.detail
+        )
+    except UserVersionMismatchError:
+        raise HTTPException(
+            status_code = status.HTTP_412_PRECONDITION_FAILED,
+            detail      = "User was modified since it was read"
+        )
+    if not user:
+        raise HTTPException(
+            status_code = status.HTTP_404_NOT_FOUND,
+            detail      = "User not found"
+        )
+    response.headers["ETag"] = user_etag(user.id, user.updated_at)
+    return user
+
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user(
+    user_id     : int,
+    current_user: CurrentUser = Depends(get_current_user),
+    db          : AsyncSession = Depends(get_async_session)
+):
+    ensure_same_user(current_user, user_id)
+    success         = await AsyncUserService.delete_user(db, user_id)
+    if not success:
+        raise HTTPException(
+            status_code = status.HTTP_404_NOT_FOUND,
+            detail      = "User not found"
+        )
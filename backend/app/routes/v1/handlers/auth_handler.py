@@ -1,8 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from sqlalchemy.orm import Session
-from app.database import get_session
+from app.database import get_session, get_read_session
+from app.database.models.user_model import User
 from app.services.auth_service import AuthService
-from app.database.schemas.auth_schema import LoginRequest, TokenResponse, RefreshTokenRequest
+from app.services.login_stats_service import LoginStatsService
+from app.database.schemas.auth_schema import LoginRequest, TokenResponse, RefreshTokenRequest, LoginStatsResponse
+from app.routes.v1.deps.auth_deps import get_current_superuser, get_access_claims
+from app.utils.stats_range import resolve_stats_range
+from datetime import datetime
+from typing import Optional
+from app.core.config import settings
+from app.utils.serialization import FastJSONResponse
 
 router = APIRouter()
 
@@ -26,6 +34,8 @@ def login(
             detail      = "Invalid credentials"
         )
     
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(token_response.model_dump())
     return token_response
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -41,17 +51,45 @@ def refresh_token(
             detail      = "Invalid or expired refresh token"
         )
     
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(token_response.model_dump())
     return token_response
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 def logout(
-    refresh_data: RefreshTokenRequest,
-    db          : Session = Depends(get_session)
+    refresh_data    : RefreshTokenRequest,
+    access_claims   : Optional[dict] = Depends(get_access_claims),
+    db              : Session = Depends(get_session)
 ):
-    success = AuthService.logout(db, refresh_data.refresh_token)
+    # A bearer token sent along is revoked too, so it stops working before its exp.
+    success = AuthService.logout(db, refresh_data.refresh_token, access_claims)
     
     if not success:
         raise HTTPException(
             status_code = status.HTTP_400_BAD_REQUEST,
             detail      = "Invalid refresh token"
-        )
\ No newline at end of file
+        )
+
+@router.get("/attempts/stats", response_model=LoginStatsResponse)
+def login_attempt_stats(
+    email       : Optional[str] = None,
+    ip          : Optional[str] = None,
+    since       : Optional[datetime] = Query(None, description="Defaults to 24 hours before until"),
+    until       : Optional[datetime] = Query(None, description="Defaults to now"),
+    superuser   : User = Depends(get_current_superuser),
+    db          : Session = Depends(get_read_session)
+):
+    """Hourly login successes and failures for one email, one IP, or everyone, served from the rollup tables."""
+    if email is not None and ip is not None:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = "Filter by email or ip, not both"
+        )
+    try:
+        since, until = resolve_stats_range(since, until, settings.LOGIN_STATS_MAX_HOURS)
+    except ValueError as e:
+        raise HTTPException(
+            status_code = status.HTTP_400_BAD_REQUEST,
+            detail      = str(e)
+        )
+    return LoginStatsService.get_stats(db, since, until, email=email, ip=ip)
@@ -1,8 +1,16 @@
 from fastapi import APIRouter
+from app.core.config import settings
 from app.routes.v1.handlers import user_handler, auth_handler
+from app.routes.v1.handlers import async_user_handler, async_auth_handler
 
 router  = APIRouter()
 
+# DB_ASYNC switches the whole v1 API between the threadpool (sync) handlers
+# and the asyncpg-backed coroutine handlers; both expose identical routes.
+if settings.DB_ASYNC:
+    user_routes, auth_routes    = async_user_handler.router, async_auth_handler.router
+else:
+    user_routes, auth_routes    = user_handler.router, auth_handler.router
 
-router.include_router(user_handler.router       , prefix="/users"        , tags=["USERS"])
-router.include_router(auth_handler.router       , prefix="/auths"        , tags=["AUTHS"])
\ No newline at end of file
+router.include_router(user_routes       , prefix="/users"        , tags=["USERS"])
+router.include_router(auth_routes       , prefix="/auths"        , tags=["AUTHS"])
@@ -1,28 +1,33 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func
 
-from app.database.models.auth_model import RefreshToken, LoginAttempt
+from app.database.models.auth_model import RefreshToken
 from app.database.models.user_model import User
-from app.services.user_service import UserService
+from app.services.user_service import UserService, AsyncUserService
+from app.services.login_attempt_writer import login_attempt_writer
+from app.services.token_revocation import revocation_list
 
-from app.core.security import create_access_token, create_refresh_token
+from app.core.rate_limit import login_throttle
+from app.core.security import create_access_token, create_refresh_token, hash_refresh_token
 from app.database.schemas.auth_schema import TokenResponse
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 class AuthService:
     
     @staticmethod
     def login(db: Session, email: str, password: str, ip_address: str) -> Optional[TokenResponse]:
-        AuthService.log_login_attempt(db, email, ip_address, False)
+        # Raises LoginThrottledError before any database or bcrypt work.
+        login_throttle.check(email, ip_address)
         
         user            = UserService.authenticate_user(db, email, password)
-        if not user or not user.is_active:
+        success         = bool(user and user.is_active)
+        AuthService.log_login_attempt(email, ip_address, success)
+        if not success:
             return None
         
-        AuthService.log_login_attempt(db, email, ip_address, True)
-        
         access_token    = create_access_token(data={"sub": str(user.id)})
         refresh_token   = create_refresh_token()
         
@@ -36,15 +41,19 @@ class AuthService:
     
     @staticmethod
     def refresh_access_token(db: Session, refresh_token: str) -> Optional[TokenResponse]:
-        token_record = AuthService.get_refresh_token(db, refresh_token)
-        if not token_record or token_record.expires_at < datetime.utcnow():
+        # Rotation is one transaction: DELETE ... RETURNING consumes the old
+        # token (only if unexpired) and the replacement is inserted before
+        # the single commit.
+        user_id = db.scalar(AuthService._consume_refresh_token_stmt(refresh_token))
+        if user_id is None:
+            db.rollback()
             return None
         
-        new_access_token    = create_access_token(data={"sub": str(token_record.user_id)})
+        new_access_token    = create_access_token(data={"sub": str(user_id)})
         new_refresh_token   = create_refresh_token()
         
-        AuthService.delete_refresh_token(db, refresh_token)
-        AuthService.store_refresh_token(db, new_refresh_token, token_record.user_id)
+        db.execute(AuthService._insert_refresh_token_stmt(new_refresh_token, user_id))
+        db.commit()
         
         return TokenResponse(
             access_token    = new_access_token,
@@ -53,44 +62,123 @@ class AuthService:
         )
     
     @staticmethod
-    def logout(db: Session, refresh_token: str) -> bool:
+    def logout(db: Session, refresh_token: str, access_claims: Optional[dict] = None) -> bool:
+        """Delete the refresh token and, when the caller's access token claims are given, revoke that token too."""
+        if access_claims and "jti" in access_claims:
+            revocation_list.revoke(db, access_claims["jti"], access_claims["exp"])
         return AuthService.delete_refresh_token(db, refresh_token)
     
     @staticmethod
-    def store_refresh_token(db: Session, token: str, user_id: int) -> RefreshToken:
-        expires_at  = datetime.utcnow() + timedelta(days=30)
-        db_token    = RefreshToken(
-            token       = token,
-            user_id     = user_id,
-            expires_at  = expires_at
-        )
-        db.add(db_token)
+    def store_refresh_token(db: Session, token: str, user_id: int) -> None:
+        db.execute(AuthService._insert_refresh_token_stmt(token, user_id))
         db.commit()
-        db.refresh(db_token)
-        return db_token
     
     @staticmethod
     def get_refresh_token(db: Session, token: str) -> Optional[RefreshToken]:
-        return db.scalar(select(RefreshToken).where(RefreshToken.token == token))
+        return db.scalar(select(RefreshToken).where(RefreshToken.token == hash_refresh_token(token)))
     
     @staticmethod
     def delete_refresh_token(db: Session, token: str) -> bool:
-        token_record = AuthService.get_refresh_token(db, token)
-        if not token_record:
-            return False
-        
-        db.delete(token_record)
+        deleted_id = db.scalar(
+            delete(RefreshToken)
+            .where(RefreshToken.token == hash_refresh_token(token))
+            .returning(RefreshToken.id)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        return True
+        return deleted_id is not None
     
     @staticmethod
-    def log_login_attempt(db: Session, email: str, ip_address: str, success: bool) -> LoginAttempt:
-        attempt = LoginAttempt(
-            email       = email,
-            ip_address  = ip_address,
-            success     = success
+    def _insert_refresh_token_stmt(token: str, user_id: int):
+        return insert(RefreshToken).values(
+            token       = hash_refresh_token(token),
+            user_id     = user_id,
+            expires_at  = datetime.now(timezone.utc) + timedelta(days=30)
         )
-        db.add(attempt)
-        db.commit()
-        db.refresh(attempt)
-        return attempt
\ No newline at end of file
+    
+    @staticmethod
+    def _consume_refresh_token_stmt(token: str):
+        return (
+            delete(RefreshToken)
+            .where(
+                RefreshToken.token      == hash_refresh_token(token),
+                RefreshToken.expires_at >  func.now()
+            )
+            .returning(RefreshToken.user_id)
+            .execution_options(synchronize_session=False)
+        )
+    
+    @staticmethod
+    def log_login_attempt(email: str, ip_address: str, success: bool) -> None:
+        # Buffered and written in batches off the request path.
+        login_attempt_writer.record(email, ip_address, success)
+
+
+class AsyncAuthService:
+
+    @staticmethod
+    async def login(db: AsyncSession, email: str, password: str, ip_address: str) -> Optional[TokenResponse]:
+        await login_throttle.acheck(email, ip_address)
+
+        user            = await AsyncUserService.authenticate_user(db, email, password)
+        success         = bool(user and user.is_active)
+        AuthService.log_login_attempt(email, ip_address, success)
+        if not success:
+            return None
+
+        access_token    = create_access_token(data={"sub": str(user.id)})
+        refresh_token   = create_refresh_token()
+
+        await AsyncAuthService.store_refresh_token(db, refresh_token, user.id)
+
+        return TokenResponse(
+            access_token    = access_token,
+            refresh_token   = refresh_token,
+            expires_in      = 1800
+        )
+
+    @staticmethod
+    async def refresh_access_token(db: AsyncSession, refresh_token: str) -> Optional[TokenResponse]:
+        user_id = await db.scalar(AuthService._consume_refresh_token_stmt(refresh_token))
+        if user_id is None:
+            await db.rollback()
+            return None
+
+        new_access_token    = create_access_token(data={"sub": str(user_id)})
+        new_refresh_token   = create_refresh_token()
+
+        await db.execute(AuthService._insert_refresh_token_stmt(new_refresh_token, user_id))
+        await db.commit()
+
+        return TokenResponse(
+            access_token    = new_access_token,
+            refresh_token   = new_refresh_token,
+            expires_in      = 1800
+        )
+
+    @staticmethod
+    async def logout(db: AsyncSession, refresh_token: str, access_claims: Optional[dict] = None) -> bool:
+        if access_claims and "jti" in access_claims:
+            await db.execute(revocation_list.revoke_stmt(access_claims["jti"], access_claims["exp"]))
+            revocation_list.add(access_claims["jti"], access_claims["exp"])
+        return await AsyncAuthService.delete_refresh_token(db, refresh_token)
+
+    @staticmethod
+    async def store_refresh_token(db: AsyncSession, token: str, user_id: int) -> None:
+        await db.execute(AuthService._insert_refresh_token_stmt(token, user_id))
+        await db.commit()
+
+    @staticmethod
+    async def get_refresh_token(db: AsyncSession, token: str) -> Optional[RefreshToken]:
+        return await db.scalar(select(RefreshToken).where(RefreshToken.token == hash_refresh_token(token)))
+
+    @staticmethod
+    async def delete_refresh_token(db: AsyncSession, token: str) -> bool:
+        deleted_id = await db.scalar(
+            delete(RefreshToken)
+            .where(RefreshToken.token == hash_refresh_token(token))
+            .returning(RefreshToken.id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return deleted_id is not None
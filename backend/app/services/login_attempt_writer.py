@@ -0,0 +1,118 @@
+import threading
+
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.database import engine
+from app.database.models.auth_model import LoginAttempt
+from app.services.login_stats_service import LoginStatsService
+
+
+class LoginAttemptWriter:
+    """
+    Buffers LoginAttempt rows in memory and writes them from a background
+    thread as one multi-row INSERT per batch, together with the hourly rollup
+    increments for that batch. A flush happens every
+    ``batch_size`` rows or ``flush_interval_ms`` milliseconds, whichever comes
+    first. At most ``max_buffer`` rows are held; beyond that new rows are
+    dropped and counted in ``dropped``. A batch that fails to write is
+    retried on its own, and dropped after ``max_write_attempts`` failures so
+    one bad batch cannot stall the writer.
+    """
+
+    def __init__(self, batch_size: int, flush_interval_ms: int, max_buffer: int, max_write_attempts: int):
+        self.batch_size         = batch_size
+        self.flush_interval     = flush_interval_ms / 1000
+        self.max_buffer         = max_buffer
+        self.max_write_attempts = max_write_attempts
+        self.dropped            = 0
+
+        self._buffer            : List[dict] = []
+        self._failed            : List[dict] = []
+        self._failed_attempts   = 0
+        self._lock              = threading.Lock()
+        self._flush_lock        = threading.Lock()
+        self._wakeup            = threading.Event()
+        self._stopping          = threading.Event()
+        self._thread            : Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="login-attempt-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def record(self, email: str, ip_address: str, success: bool) -> None:
+        row = {
+            "email"         : email,
+            "ip_address"    : ip_address,
+            "success"       : success,
+            "attempted_at"  : datetime.now(timezone.utc)
+        }
+        with self._lock:
+            if len(self._buffer) >= self.max_buffer:
+                self.dropped += 1
+                return
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            rows = self._failed
+            if not rows:
+                with self._lock:
+                    rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(LoginAttempt), rows)
+                    LoginStatsService.apply_rollups(conn, rows)
+            except Exception:
+                self._failed_attempts += 1
+                if self._failed_attempts < self.max_write_attempts:
+                    logger.exception(f"Failed to write {len(rows)} login attempts (attempt {self._failed_attempts}), retrying")
+                    self._failed = rows
+                    return 0
+                logger.exception(f"Dropping {len(rows)} login attempts after {self._failed_attempts} failed writes")
+                with self._lock:
+                    self.dropped += len(rows)
+                written = 0
+            else:
+                written = len(rows)
+
+            self._failed            = []
+            self._failed_attempts   = 0
+            return written
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+        self.flush()
+
+
+login_attempt_writer = LoginAttemptWriter(
+    batch_size          = settings.LOGIN_ATTEMPT_BATCH_SIZE,
+    flush_interval_ms   = settings.LOGIN_ATTEMPT_FLUSH_INTERVAL_MS,
+    max_buffer          = settings.LOGIN_ATTEMPT_BUFFER_SIZE,
+    max_write_attempts  = settings.LOGIN_ATTEMPT_MAX_WRITE_ATTEMPTS
+)
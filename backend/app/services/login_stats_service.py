@@ -0,0 +1,190 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import engine
+from app.database.models.auth_model import LoginAttempt, LoginAttemptHourlyByEmail, LoginAttemptHourlyByIp
+from app.database.schemas.auth_schema import LoginStatsBucket, LoginStatsResponse
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Each rollup table and the LoginAttempt column it is keyed by.
+ROLLUPS = (
+    (LoginAttemptHourlyByEmail  , "email"),
+    (LoginAttemptHourlyByIp     , "ip_address"),
+)
+
+def _hour(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+def _hour_of(column):
+    # Three-argument date_trunc buckets in UTC whatever the session TimeZone.
+    return func.date_trunc("hour", column, "UTC")
+
+
+class LoginStatsService:
+
+    @staticmethod
+    def aggregate(rows: List[dict]) -> List[Tuple[type, List[dict]]]:
+        """Hourly success/failure counts of raw login attempt rows, per rollup table."""
+        result = []
+        for model, key in ROLLUPS:
+            counts : Dict[Tuple[datetime, str], List[int]] = {}
+            for row in rows:
+                bucket = counts.setdefault((_hour(row["attempted_at"]), row[key]), [0, 0])
+                bucket[0 if row["success"] else 1] += 1
+            # Sorted, so concurrent writers lock rollup rows in the same order.
+            result.append((model, [
+                {"bucket": hour, key: value, "successes": successes, "failures": failures}
+                for (hour, value), (successes, failures) in sorted(counts.items())
+            ]))
+        return result
+
+    @staticmethod
+    def apply_rollups(conn, rows: List[dict]) -> None:
+        """Add the counts of ``rows`` to the rollups, in the caller's transaction."""
+        for model, values in LoginStatsService.aggregate(rows):
+            if values:
+                conn.execute(LoginStatsService._increment_stmt(model), values)
+
+    @staticmethod
+    def _increment_stmt(model):
+        stmt = pg_insert(model)
+        return stmt.on_conflict_do_update(
+            index_elements  = list(model.__table__.primary_key.columns),
+            set_            = {
+                "successes" : model.successes + stmt.excluded.successes,
+                "failures"  : model.failures + stmt.excluded.failures,
+            }
+        )
+
+    @staticmethod
+    def _brute_force_select(key: str, since: datetime, until: datetime):
+        column = getattr(LoginAttempt, key)
+        return (
+            select(
+                _hour_of(LoginAttempt.attempted_at).label("bucket"),
+                column,
+                func.count().filter(LoginAttempt.success).label("successes"),
+                func.count().filter(~LoginAttempt.success).label("failures")
+            )
+            .where(LoginAttempt.attempted_at >= since, LoginAttempt.attempted_at < until)
+            .group_by(_hour_of(LoginAttempt.attempted_at), column)
+        )
+
+    @staticmethod
+    def backfill(since: datetime, until: datetime, chunk: timedelta = timedelta(days=1)) -> int:
+        """
+        Recompute rollups from login_attempts for whole hours in [since, until),
+        one ``chunk`` per transaction. Rows are replaced, not incremented, so
+        re-running is safe; rollups whose raw rows were already dropped are
+        kept. Only run it on closed hours, as live writes would be double-counted.
+        """
+        start, until    = _hour(since), _hour(until)
+        written         = 0
+        while start < until:
+            end = min(start + chunk, until)
+            with engine.begin() as conn:
+                for model, key in ROLLUPS:
+                    stmt    = pg_insert(model).from_select(
+                        ["bucket", key, "successes", "failures"],
+                        LoginStatsService._brute_force_select(key, start, end)
+                    )
+                    stmt    = stmt.on_conflict_do_update(
+                        index_elements  = list(model.__table__.primary_key.columns),
+                        set_            = {"successes": stmt.excluded.successes, "failures": stmt.excluded.failures}
+                    )
+                    written += conn.execute(stmt).rowcount
+            start = end
+        return written
+
+    @staticmethod
+    def verify(since: datetime, until: datetime) -> List[str]:
+        """Compare rollups for [since, until) with a brute-force aggregate of login_attempts; return mismatches."""
+        since, until    = _hour(since), _hour(until)
+        mismatches      = []
+        with engine.connect() as conn:
+            for model, key in ROLLUPS:
+                column      = getattr(model, key)
+                expected    = {
+                    (row.bucket, row[1]): (row.successes, row.failures)
+                    for row in conn.execute(LoginStatsService._brute_force_select(key, since, until))
+                }
+                actual      = {
+                    (row.bucket, row[1]): (row.successes, row.failures)
+                    for row in conn.execute(
+                        select(model.bucket, column, model.successes, model.failures)
+                        .where(model.bucket >= since, model.bucket < until)
+                    )
+                }
+                for bucket_key in sorted(expected.keys() | actual.keys()):
+                    if expected.get(bucket_key, (0, 0)) != actual.get(bucket_key, (0, 0)):
+                        mismatches.append(
+                            f"{model.__tablename__} {bucket_key[0].isoformat()} {bucket_key[1]}: "
+                            f"rollup {actual.get(bucket_key, (0, 0))} != raw {expected.get(bucket_key, (0, 0))}"
+                        )
+        return mismatches
+
+    @staticmethod
+    def get_stats(
+        db      : Session,
+        since   : datetime,
+        until   : datetime,
+        email   : Optional[str] = None,
+        ip      : Optional[str] = None
+    ) -> LoginStatsResponse:
+        return LoginStatsService._to_response(db.execute(LoginStatsService._stats_stmt(since, until, email, ip)).all())
+
+    @staticmethod
+    def _stats_stmt(since: datetime, until: datetime, email: Optional[str], ip: Optional[str]):
+        # Totals across everyone come from the per-IP table: every attempt has exactly one IP.
+        model, condition = LoginAttemptHourlyByIp, None
+        if email is not None:
+            model, condition = LoginAttemptHourlyByEmail, LoginAttemptHourlyByEmail.email == email
+        elif ip is not None:
+            condition = LoginAttemptHourlyByIp.ip_address == ip
+
+        stmt = (
+            select(model.bucket, func.sum(model.successes).label("successes"), func.sum(model.failures).label("failures"))
+            .where(and_(model.bucket >= _hour(since), model.bucket < until))
+            .group_by(model.bucket)
+            .order_by(model.bucket)
+        )
+        return stmt.where(condition) if condition is not None else stmt
+
+    @staticmethod
+    def _to_response(rows: Sequence) -> LoginStatsResponse:
+        buckets     = [
+            LoginStatsBucket(
+                bucket          = row.bucket,
+                successes       = row.successes,
+                failures        = row.failures,
+                failure_rate    = row.failures / (row.successes + row.failures)
+            )
+            for row in rows
+        ]
+        successes   = sum(bucket.successes for bucket in buckets)
+        failures    = sum(bucket.failures for bucket in buckets)
+        total       = successes + failures
+        return LoginStatsResponse(
+            buckets         = buckets,
+            successes       = successes,
+            failures        = failures,
+            failure_rate    = failures / total if total else 0.0
+        )
+
+
+class AsyncLoginStatsService:
+
+    @staticmethod
+    async def get_stats(
+        db      : AsyncSession,
+        since   : datetime,
+        until   : datetime,
+        email   : Optional[str] = None,
+        ip      : Optional[str] = None
+    ) -> LoginStatsResponse:
+        rows = (await db.execute(LoginStatsService._stats_stmt(since, until, email, ip))).all()
+        return LoginStatsService._to_response(rows)
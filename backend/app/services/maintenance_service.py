@@ -0,0 +1,178 @@
+import asyncio
+import re
+
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+import anyio
+
+from sqlalchemy import delete, select, func, text
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.database import engine
+from app.database.models.auth_model import RefreshToken, RevokedToken
+
+PARTITION_NAME      = re.compile(r"^login_attempts_y(\d{4})m(\d{2})$")
+DEFAULT_PARTITION   = "login_attempts_default"
+
+# Several workers run the loop; partition DDL is done by whichever one
+# takes this advisory lock first.
+PARTITION_LOCK_KEY  = 0x6C6F67696E
+
+def _month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+def _partition_name(month: date) -> str:
+    return f"login_attempts_y{month.year:04d}m{month.month:02d}"
+
+def _in_month(month: date) -> str:
+    return f"attempted_at >= '{month.isoformat()} 00:00:00+00' AND attempted_at < '{_next_month(month).isoformat()} 00:00:00+00'"
+
+
+class MaintenanceService:
+
+    @staticmethod
+    def purge_expired_refresh_tokens(batch_size: int) -> int:
+        return MaintenanceService._purge_expired(RefreshToken.id, RefreshToken.expires_at, batch_size)
+
+    @staticmethod
+    def purge_expired_revoked_tokens(batch_size: int) -> int:
+        # A revoked token past its exp is rejected by its signature check anyway.
+        return MaintenanceService._purge_expired(RevokedToken.jti, RevokedToken.expires_at, batch_size)
+
+    @staticmethod
+    def _purge_expired(key, expires_at, batch_size: int) -> int:
+        """
+        Delete expired rows ``batch_size`` rows per transaction, so no single
+        statement holds row locks for long. Rows locked by another worker's
+        batch are skipped rather than waited on.
+        """
+        table   = key.class_
+        expired = (
+            select(key)
+            .where(expires_at <= func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt    = delete(table).where(key.in_(expired))
+
+        total = 0
+        while True:
+            with engine.begin() as conn:
+                deleted = conn.execute(stmt).rowcount
+            total += deleted
+            if deleted < batch_size:
+                return total
+
+    @staticmethod
+    def get_login_attempt_partitions(conn) -> List[str]:
+        rows = conn.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = 'login_attempts'"
+        ))
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def maintain_login_attempt_partitions(months_ahead: int, retention_days: int) -> None:
+        """
+        Create monthly partitions through ``months_ahead`` months from now and
+        drop those whose whole month is older than ``retention_days``.
+        Dropping a partition is a catalog change, not a mass DELETE. Rows that
+        landed in the DEFAULT partition because their month had no partition
+        yet are moved into one.
+        """
+        today   = datetime.now(timezone.utc).date()
+        cutoff  = today - timedelta(days=retention_days)
+
+        with engine.begin() as conn:
+            if not conn.execute(select(func.pg_try_advisory_xact_lock(PARTITION_LOCK_KEY))).scalar():
+                return
+            # Partition DDL locks the parent; give up instead of stalling inserts.
+            conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+
+            existing    = set(MaintenanceService.get_login_attempt_partitions(conn))
+            months      = set()
+            month       = _month_start(today)
+            for _ in range(months_ahead + 1):
+                months.add(month)
+                month = _next_month(month)
+            if DEFAULT_PARTITION in existing:
+                months.update(
+                    row[0].date()
+                    for row in conn.execute(text(
+                        f"SELECT DISTINCT date_trunc('month', attempted_at, 'UTC') AT TIME ZONE 'UTC' FROM {DEFAULT_PARTITION}"
+                    ))
+                )
+
+            for month in sorted(months):
+                if _partition_name(month) not in existing and _next_month(month) > cutoff:
+                    MaintenanceService._create_partition(conn, month, DEFAULT_PARTITION in existing)
+
+            for name in sorted(existing):
+                match = PARTITION_NAME.match(name)
+                if match is None:
+                    continue
+                month = date(int(match.group(1)), int(match.group(2)), 1)
+                if _next_month(month) <= cutoff:
+                    conn.execute(text(f"DROP TABLE {name}"))
+                    logger.info(f"Dropped expired partition {name}")
+
+            if DEFAULT_PARTITION in existing:
+                conn.execute(text(
+                    f"DELETE FROM {DEFAULT_PARTITION} WHERE attempted_at < '{_month_start(cutoff).isoformat()} 00:00:00+00'"
+                ))
+
+    @staticmethod
+    def _create_partition(conn, month: date, has_default: bool) -> None:
+        name    = _partition_name(month)
+        upper   = _next_month(month)
+        bounds  = f"FROM ('{month.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+        strays  = 0
+        if has_default:
+            strays = conn.execute(text(
+                f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {_in_month(month)}"
+            )).scalar()
+
+        if not strays:
+            conn.execute(text(f"CREATE TABLE {name} PARTITION OF login_attempts FOR VALUES {bounds}"))
+            logger.info(f"Created partition {name}")
+            return
+
+        # A partition cannot be created over rows still in the DEFAULT
+        # partition: fill a plain table, then attach it (indexes are added then).
+        conn.execute(text(f"CREATE TABLE {name} (LIKE login_attempts INCLUDING DEFAULTS)"))
+        conn.execute(text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {_in_month(month)} RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ))
+        conn.execute(text(f"ALTER TABLE login_attempts ATTACH PARTITION {name} FOR VALUES {bounds}"))
+        logger.warning(f"Created partition {name} and moved {strays} login attempts into it from {DEFAULT_PARTITION}")
+
+    @staticmethod
+    def run_once() -> None:
+        purged = MaintenanceService.purge_expired_refresh_tokens(settings.TOKEN_PURGE_BATCH_SIZE)
+        if purged:
+            logger.info(f"Purged {purged} expired refresh tokens")
+        purged = MaintenanceService.purge_expired_revoked_tokens(settings.TOKEN_PURGE_BATCH_SIZE)
+        if purged:
+            logger.info(f"Purged {purged} expired revoked access tokens")
+        MaintenanceService.maintain_login_attempt_partitions(
+            months_ahead    = settings.LOGIN_ATTEMPT_PARTITIONS_AHEAD,
+            retention_days  = settings.LOGIN_ATTEMPT_RETENTION_DAYS
+        )
+
+
+async def run_maintenance_loop(interval_seconds: float) -> None:
+    """Run MaintenanceService.run_once every ``interval_seconds``, off the event loop, until cancelled."""
+    while True:
+        try:
+            await anyio.to_thread.run_sync(MaintenanceService.run_once)
+        except Exception:
+            logger.exception("Maintenance run failed")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,116 @@
+import threading
+import time
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.database import engine
+from app.database.models.auth_model import RevokedToken
+
+
+class RevocationList:
+    """
+    In-memory set of revoked access-token ids (``jti``), each kept until its
+    token's own ``exp`` so the set never outgrows the tokens still in
+    circulation. ``is_revoked`` is a dict lookup; Postgres is only read by a
+    background thread that pulls revocations made by other workers every
+    ``sync_interval`` seconds, so another worker may accept a revoked token
+    for up to that long.
+    """
+
+    def __init__(self, sync_interval: float, overlap_seconds: float):
+        self.sync_interval      = sync_interval
+        self.overlap            = timedelta(seconds=overlap_seconds)
+
+        self._revoked           : Dict[str, float] = {}
+        self._lock              = threading.Lock()
+        self._watermark         : Optional[datetime] = None
+        self._stopping          = threading.Event()
+        self._thread            : Optional[threading.Thread] = None
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        if jti is None:
+            return False
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def add(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def revoke(self, db, jti: str, expires_at: float) -> None:
+        """Record a revocation in the caller's (sync) session and apply it to this worker at once."""
+        db.execute(RevocationList.revoke_stmt(jti, expires_at))
+        self.add(jti, expires_at)
+
+    @staticmethod
+    def revoke_stmt(jti: str, expires_at: float):
+        return (
+            pg_insert(RevokedToken)
+            .values(jti=jti, expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc))
+            .on_conflict_do_nothing()
+        )
+
+    def sync(self) -> int:
+        """
+        Pull revocations newer than the last sync, minus an overlap window:
+        ``revoked_at`` is the inserting transaction's start time, so a row can
+        become visible after rows with later timestamps.
+        """
+        started = datetime.now(timezone.utc)
+        stmt    = select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > started)
+        if self._watermark is not None:
+            stmt = stmt.where(RevokedToken.revoked_at > self._watermark - self.overlap)
+
+        with engine.connect() as conn:
+            rows = conn.execute(stmt).all()
+
+        now = time.time()
+        with self._lock:
+            for jti, expires_at in rows:
+                self._revoked[jti] = expires_at.timestamp()
+            for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+                del self._revoked[jti]
+        self._watermark = started
+        return len(rows)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        # Load current revocations before serving, so a fresh worker never
+        # accepts a token that was revoked before it started.
+        try:
+            self.sync()
+        except Exception:
+            logger.exception("Initial revocation sync failed, retrying in the background")
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="revocation-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.sync_interval):
+            try:
+                self.sync()
+            except Exception:
+                logger.exception("Revocation sync failed")
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revocation_list = RevocationList(
+    sync_interval   = settings.REVOCATION_SYNC_INTERVAL_SECONDS,
+    overlap_seconds = settings.REVOCATION_SYNC_OVERLAP_SECONDS
+)
@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Optional
+
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.database.models.user_model import User
+
+# No password hash: authentication always reads the row (see UserService.load_user_by_email).
+CACHED_FIELDS = ("id", "email", "username", "is_active", "is_superuser", "created_at", "updated_at")
+
+
+class UserCache:
+    """
+    Read-through cache for user lookups. The full row is stored once under its
+    id; email and username keys only point at that id. Invalidating a user
+    therefore only needs its id key: a stale email/username pointer resolves
+    to a row whose field no longer matches and is treated as a miss.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    @property
+    def stats(self):
+        return self.backend.stats
+
+    def get(self, user_id: int) -> Optional[User]:
+        payload = self.backend.get(f"id:{user_id}")
+        return UserCache.to_user(payload) if payload else None
+
+    def lookup(self, field: str, value: str) -> Optional[User]:
+        user_id = self.backend.get(f"{field}:{value}")
+        if user_id is None:
+            return None
+        return UserCache._matching(self.backend.get(f"id:{user_id}"), field, value)
+
+    def store(self, user: User) -> None:
+        for key, value in UserCache._entries(user):
+            self.backend.set(key, value)
+
+    def invalidate(self, user_id: int) -> None:
+        self.backend.delete(f"id:{user_id}")
+
+    # Async variants for the async stack; they never block the event loop.
+
+    async def aget(self, user_id: int) -> Optional[User]:
+        payload = await self.backend.aget(f"id:{user_id}")
+        return UserCache.to_user(payload) if payload else None
+
+    async def alookup(self, field: str, value: str) -> Optional[User]:
+        user_id = await self.backend.aget(f"{field}:{value}")
+        if user_id is None:
+            return None
+        return UserCache._matching(await self.backend.aget(f"id:{user_id}"), field, value)
+
+    async def astore(self, user: User) -> None:
+        for key, value in UserCache._entries(user):
+            await self.backend.aset(key, value)
+
+    async def ainvalidate(self, user_id: int) -> None:
+        await self.backend.adelete(f"id:{user_id}")
+
+    @staticmethod
+    def _entries(user: User):
+        return (
+            (f"id:{user.id}"                , UserCache.to_payload(user)),
+            (f"email:{user.email}"          , user.id),
+            (f"username:{user.username}"    , user.id),
+        )
+
+    @staticmethod
+    def _matching(payload: Optional[dict], field: str, value: str) -> Optional[User]:
+        if not payload or payload[field] != value:
+            return None
+        return UserCache.to_user(payload)
+
+    @staticmethod
+    def to_payload(user: User) -> dict:
+        payload = {field: getattr(user, field) for field in CACHED_FIELDS}
+        payload["created_at"] = user.created_at.isoformat() if user.created_at else None
+        payload["updated_at"] = user.updated_at.isoformat() if user.updated_at else None
+        return payload
+
+    @staticmethod
+    def to_user(payload: dict) -> User:
+        # Detached, read-only instance: writes always reload the row in their own session.
+        data = dict(payload)
+        data["created_at"] = datetime.fromisoformat(data["created_at"]) if data["created_at"] else None
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None
+        return User(**data)
+
+
+user_cache = UserCache(
+    create_cache(
+        settings.USER_CACHE_BACKEND,
+        max_size    = settings.USER_CACHE_MAX_SIZE,
+        ttl_seconds = settings.USER_CACHE_TTL_SECONDS,
+        prefix      = "user:"
+    )
+)
@@ -0,0 +1,66 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, case, cast, literal, or_, and_, Float
+
+from app.core.config import settings
+from app.database.models.user_model import User
+from app.utils.serialization import USER_RESPONSE_COLUMNS
+
+from typing import Optional, Sequence, Tuple
+
+# Trigram indexes cannot serve queries shorter than one trigram; those (and
+# the prefix backend) use the lower(...) text_pattern_ops btree indexes.
+TRIGRAM_MIN_LENGTH = 3
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class UserSearchService:
+
+    @staticmethod
+    def search_users(
+        db      : Session,
+        query   : str,
+        limit   : int = 20,
+        after   : Optional[Tuple[float, int]] = None
+    ) -> Sequence:
+        """Rows of UserResponse columns plus ``score``, best match first; ``after`` is the last (score, id) seen."""
+        return db.execute(UserSearchService._search_stmt(query, limit, after)).all()
+
+    @staticmethod
+    def _search_stmt(query: str, limit: int, after: Optional[Tuple[float, int]] = None, backend: Optional[str] = None):
+        term        = query.strip().lower()
+        backend     = backend or settings.USER_SEARCH_BACKEND
+        username    = func.lower(User.username)
+        email       = func.lower(User.email)
+        prefix      = _escape_like(term) + "%"
+        is_prefix   = or_(username.like(prefix, escape="\\"), email.like(prefix, escape="\\"))
+
+        if backend == "trigram" and len(term) >= TRIGRAM_MIN_LENGTH:
+            # `%` is pg_trgm's similarity operator, served by the GIN indexes;
+            # prefix matches rank above fuzzy ones.
+            similarity  = func.greatest(func.similarity(username, term), func.similarity(email, term))
+            score       = cast(similarity + case((is_prefix, 1.0), else_=0.0), Float)
+            condition   = or_(username.op("%")(term), email.op("%")(term), is_prefix)
+        else:
+            score       = cast(literal(1.0), Float)
+            condition   = is_prefix
+
+        stmt = select(*USER_RESPONSE_COLUMNS, score.label("score")).where(condition)
+        if after is not None:
+            after_score, after_id = after
+            stmt = stmt.where(or_(score < after_score, and_(score == after_score, User.id > after_id)))
+        return stmt.order_by(score.desc(), User.id).limit(limit)
+
+
+class AsyncUserSearchService:
+
+    @staticmethod
+    async def search_users(
+        db      : AsyncSession,
+        query   : str,
+        limit   : int = 20,
+        after   : Optional[Tuple[float, int]] = None
+    ) -> Sequence:
+        return (await db.execute(UserSearchService._search_stmt(query, limit, after))).all()
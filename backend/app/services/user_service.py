@@ -1,71 +1,545 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, update, func, cast, bindparam, Integer, String, Boolean
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 
+from app.core.config import settings
+from app.core.enum import ExportFormat
+from app.database import open_read_session, open_async_read_session, is_primary_session
 from app.database.models.user_model import User
-from app.database.schemas.user_schema import UserCreate, UserUpdate
-from app.core.security import hash_password, verify_password
+from app.database.schemas.user_schema import (
+    UserCreate, UserUpdate, BulkUserCreate, BulkUserCreated, BulkUserConflict,
+    BulkUserCreateResponse, BulkUserUpdate, BulkUserUpdateResponse
+)
+from app.core.hashing import password_hasher
+from app.services.user_cache import UserCache, user_cache
+from app.utils.singleflight import SingleFlight, AsyncSingleFlight
+from app.utils.serialization import USER_RESPONSE_COLUMNS
 
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Iterator, AsyncIterator, Sequence, Dict, Tuple
+import csv
+import io
+import json
+
+EXPORT_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.is_active,
+    User.is_superuser,
+    User.created_at,
+    User.updated_at,
+)
+
+# Unique indexes on users, mapped to the error reported for each.
+UNIQUE_CONSTRAINT_DETAILS = {
+    "ix_users_email"    : "Email already registered",
+    "ix_users_username" : "Username already taken",
+}
+
+# The user cache is only filled from primary sessions. A row read from a
+# lagging replica right after a write would otherwise put the pre-write row
+# back under a key the write just invalidated, and cache hits (ETags
+# included) are served without looking at the session at all.
+
+# Concurrent cache misses for the same id share one SELECT, run by the first
+# caller on its own (read) session. Flights are keyed by the session's bind,
+# so a client pinned to the primary never receives a replica's row. Callers
+# receive the row as a cache payload and build their own detached User from
+# it, so no ORM instance crosses sessions or threads.
+user_fetches        = SingleFlight("user_by_id")
+async_user_fetches  = AsyncSingleFlight("user_by_id")
+
+class UserAlreadyExistsError(Exception):
+    """Raised when a write violates the unique email or username constraint."""
+
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+class UserVersionMismatchError(Exception):
+    """Raised when a conditional update names a version (If-Match) that is no longer current."""
 
 class UserService:
     
     @staticmethod
     def create_user(db: Session, user_data: UserCreate) -> User:
-        hashed_password = hash_password(user_data.password)
-        db_user = User(
-            email               = user_data.email,
-            username            = user_data.username,
-            hashed_password     = hashed_password,
-            is_active           = user_data.is_active
-        )
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        # One INSERT ... RETURNING; the unique indexes are the duplicate check.
+        hashed_password = password_hasher.hash_sync(user_data.password)
+        try:
+            db_user = db.scalar(UserService._create_user_stmt(user_data, hashed_password))
+            db.expunge(db_user)
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise UserAlreadyExistsError(UserService._conflict_detail(e)) from e
         return db_user
     
     @staticmethod
     def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
+        user = user_cache.get(user_id)
+        if user is None:
+            payload = user_fetches.do((db.get_bind(), user_id), lambda: UserService._fetch_user_payload(db, user_id))
+            user    = UserCache.to_user(payload) if payload else None
+        return user
+    
+    @staticmethod
+    def _fetch_user_payload(db: Session, user_id: int) -> Optional[dict]:
+        user = db.scalar(select(User).where(User.id == user_id))
+        if user is None:
+            return None
+        if is_primary_session(db):
+            user_cache.store(user)
+        return UserCache.to_payload(user)
+    
+    @staticmethod
+    def load_user_by_id(db: Session, user_id: int) -> Optional[User]:
+        # Uncached reads for authentication: a password change or deactivation applies at once.
         return db.scalar(select(User).where(User.id == user_id))
     
     @staticmethod
-    def get_user_by_email(db: Session, email: str) -> Optional[User]:
+    def load_user_by_email(db: Session, email: str) -> Optional[User]:
         return db.scalar(select(User).where(User.email == email))
     
+    @staticmethod
+    def get_user_by_email(db: Session, email: str) -> Optional[User]:
+        user = user_cache.lookup("email", email)
+        if user is None:
+            user = db.scalar(select(User).where(User.email == email))
+            if user and is_primary_session(db):
+                user_cache.store(user)
+        return user
+    
     @staticmethod
     def get_user_by_username(db: Session, username: str) -> Optional[User]:
-        return db.scalar(select(User).where(User.username == username))
+        user = user_cache.lookup("username", username)
+        if user is None:
+            user = db.scalar(select(User).where(User.username == username))
+            if user and is_primary_session(db):
+                user_cache.store(user)
+        return user
     
     @staticmethod
     def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-        return db.scalars(select(User).offset(skip).limit(limit)).all()
+        return db.scalars(select(User).order_by(User.id).offset(skip).limit(limit)).all()
     
     @staticmethod
-    def update_user(db: Session, user_id: int, user_data: UserUpdate) -> Optional[User]:
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
-            return None
+    def get_users_after(db: Session, after_id: int, limit: int = 100) -> List[User]:
+        # Keyset pagination: an index range scan on the primary key, no matter how deep the page.
+        return db.scalars(select(User).where(User.id > after_id).order_by(User.id).limit(limit)).all()
+    
+    @staticmethod
+    def get_user_rows(db: Session, skip: int = 0, limit: int = 100) -> Sequence:
+        # Columns-only variants of get_users/get_users_after for the fast serialization path.
+        return db.execute(select(*USER_RESPONSE_COLUMNS).order_by(User.id).offset(skip).limit(limit)).all()
+    
+    @staticmethod
+    def get_user_rows_after(db: Session, after_id: int, limit: int = 100) -> Sequence:
+        return db.execute(
+            select(*USER_RESPONSE_COLUMNS).where(User.id > after_id).order_by(User.id).limit(limit)
+        ).all()
+    
+    @staticmethod
+    def export_users(fmt: ExportFormat) -> Iterator[str]:
+        # Uses its own (replica) session so the server-side cursor lives exactly as long as the stream.
+        with open_read_session() as db:
+            result = db.execute(
+                select(*EXPORT_COLUMNS)
+                .order_by(User.id)
+                .execution_options(yield_per=settings.USER_EXPORT_BATCH_SIZE)
+            )
+            if fmt == ExportFormat.CSV:
+                yield UserService._render_export_header()
+            for rows in result.partitions():
+                yield UserService._render_export_rows(rows, fmt)
+    
+    @staticmethod
+    def _render_export_header() -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow([column.key for column in EXPORT_COLUMNS])
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _render_export_rows(rows: Sequence, fmt: ExportFormat) -> str:
+        records = ([UserService._export_value(value) for value in row] for row in rows)
+        
+        if fmt == ExportFormat.CSV:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(records)
+            return buffer.getvalue()
         
+        keys = [column.key for column in EXPORT_COLUMNS]
+        return "".join(json.dumps(dict(zip(keys, record))) + "\n" for record in records)
+    
+    @staticmethod
+    def _export_value(value):
+        return value.isoformat() if isinstance(value, datetime) else value
+    
+    @staticmethod
+    def update_user(
+        db                  : Session,
+        user_id             : int,
+        user_data           : UserUpdate,
+        expected_versions   : Optional[List[datetime]] = None
+    ) -> Optional[User]:
+        # One UPDATE ... RETURNING; writes never read through the cache. With
+        # expected_versions the row is only updated if updated_at still matches.
         update_data = user_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user, field, value)
+        if not update_data:
+            user = db.get(User, user_id)
+            if user and expected_versions is not None and user.updated_at not in expected_versions:
+                raise UserVersionMismatchError()
+            return user
         
-        db.commit()
-        db.refresh(user)
+        try:
+            user = db.scalar(
+                UserService._update_user_stmt(user_id, update_data, expected_versions),
+                execution_options = {"synchronize_session": False}
+            )
+            if user:
+                db.expunge(user)
+            elif expected_versions is not None and db.scalar(select(User.id).where(User.id == user_id)):
+                db.rollback()
+                raise UserVersionMismatchError()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise UserAlreadyExistsError(UserService._conflict_detail(e)) from e
+        
+        user_cache.invalidate(user_id)
         return user
     
+    @staticmethod
+    def _create_user_stmt(user_data: UserCreate, hashed_password: str):
+        return insert(User).values(
+            email               = user_data.email,
+            username            = user_data.username,
+            hashed_password     = hashed_password,
+            is_active           = user_data.is_active
+        ).returning(User)
+    
+    @staticmethod
+    def _update_user_stmt(user_id: int, update_data: dict, expected_versions: Optional[List[datetime]] = None):
+        stmt = update(User).where(User.id == user_id)
+        if expected_versions is not None:
+            stmt = stmt.where(User.updated_at.in_(expected_versions))
+        return stmt.values(**update_data).returning(User)
+    
+    @staticmethod
+    def get_user_version(db: Session, user_id: int) -> Optional[datetime]:
+        # Cheap version probe for conditional GETs: cache hit, else a single-column SELECT.
+        user = user_cache.get(user_id)
+        if user is not None:
+            return user.updated_at
+        return db.scalar(select(User.updated_at).where(User.id == user_id))
+    
+    @staticmethod
+    def _conflict_detail(error: IntegrityError) -> str:
+        # psycopg2 exposes the violated constraint on .diag, asyncpg on the wrapped cause.
+        orig        = error.orig
+        constraint  = (
+            getattr(getattr(orig, "diag", None), "constraint_name", None)
+            or getattr(getattr(orig, "__cause__", None), "constraint_name", None)
+            or str(orig)
+        )
+        for name, detail in UNIQUE_CONSTRAINT_DETAILS.items():
+            if name in constraint:
+                return detail
+        return "User already exists"
+    
     @staticmethod
     def delete_user(db: Session, user_id: int) -> bool:
-        user = UserService.get_user_by_id(db, user_id)
+        user = db.get(User, user_id)
         if not user:
             return False
         
         db.delete(user)
         db.commit()
+        user_cache.invalidate(user_id)
         return True
     
     @staticmethod
     def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-        user = UserService.get_user_by_email(db, email)
-        if not user or not verify_password(password, user.hashed_password):
+        user = UserService.load_user_by_email(db, email)
+        if not user or not password_hasher.verify_sync(password, user.hashed_password):
+            return None
+        return user
+    
+    @staticmethod
+    def bulk_create_users(db: Session, users: List[BulkUserCreate]) -> BulkUserCreateResponse:
+        plain   = [index for index, user in enumerate(users) if user.password is not None]
+        hashes  = password_hasher.hash_many_sync([users[index].password for index in plain])
+        rows    = UserService._bulk_insert_rows(users, dict(zip(plain, hashes)))
+        
+        response = BulkUserCreateResponse(created=[], conflicts=[])
+        for start in range(0, len(rows), settings.BULK_USER_CHUNK_SIZE):
+            chunk       = rows[start:start + settings.BULK_USER_CHUNK_SIZE]
+            inserted    = db.execute(UserService._bulk_insert_stmt(chunk)).all()
+            UserService._collect_bulk_results(start, chunk, inserted, response)
+        
+        db.commit()
+        return response
+    
+    @staticmethod
+    def bulk_update_users(db: Session, updates: List[BulkUserUpdate]) -> BulkUserUpdateResponse:
+        # Raises IntegrityError if a new email/username collides; nothing is applied then.
+        requested   = UserService._dedupe_updates(updates)
+        updated     = db.scalars(
+            UserService._bulk_update_stmt(requested),
+            execution_options = {"synchronize_session": False}
+        ).all()
+        db.commit()
+        
+        for user_id in updated:
+            user_cache.invalidate(user_id)
+        return BulkUserUpdateResponse(
+            updated     = sorted(updated),
+            not_found   = sorted(set(requested) - set(updated))
+        )
+    
+    @staticmethod
+    def _bulk_insert_rows(users: List[BulkUserCreate], hashes: Dict[int, str]) -> List[dict]:
+        return [
+            {
+                "email"             : user.email,
+                "username"          : user.username,
+                "hashed_password"   : hashes.get(index, user.hashed_password),
+                "is_active"         : user.is_active,
+                "is_superuser"      : False,
+            }
+            for index, user in enumerate(users)
+        ]
+    
+    @staticmethod
+    def _bulk_insert_stmt(rows: List[dict]):
+        return (
+            pg_insert(User)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(User.id, User.email, User.username)
+        )
+    
+    @staticmethod
+    def _collect_bulk_results(offset: int, rows: List[dict], inserted: Sequence, response: BulkUserCreateResponse) -> None:
+        # RETURNING only yields inserted rows; match them back to request positions
+        # by (email, username) so in-batch duplicates are reported as conflicts too.
+        pending: Dict[Tuple[str, str], List[int]] = {}
+        for index, row in enumerate(rows, start=offset):
+            pending.setdefault((row["email"], row["username"]), []).append(index)
+        
+        created = set()
+        for user_id, email, username in inserted:
+            index = pending[(email, username)].pop(0)
+            created.add(index)
+            response.created.append(BulkUserCreated(index=index, id=user_id))
+        
+        for index, row in enumerate(rows, start=offset):
+            if index not in created:
+                response.conflicts.append(BulkUserConflict(index=index, email=row["email"], username=row["username"]))
+    
+    @staticmethod
+    def _dedupe_updates(updates: List[BulkUserUpdate]) -> Dict[int, BulkUserUpdate]:
+        # The last change for an id wins; UPDATE ... FROM must see each id once.
+        return {update_data.id: update_data for update_data in updates}
+    
+    @staticmethod
+    def _bulk_update_stmt(requested: Dict[int, BulkUserUpdate]):
+        # One UPDATE ... FROM unnest(...) with four array parameters, however many rows.
+        # NULL means "leave unchanged", matching UserUpdate's unset fields.
+        changes = list(requested.values())
+        rows    = func.unnest(
+            cast(bindparam("ids", [c.id for c in changes], type_=ARRAY(Integer)), ARRAY(Integer)),
+            cast(bindparam("emails", [c.email for c in changes], type_=ARRAY(String)), ARRAY(String)),
+            cast(bindparam("usernames", [c.username for c in changes], type_=ARRAY(String)), ARRAY(String)),
+            cast(bindparam("actives", [c.is_active for c in changes], type_=ARRAY(Boolean)), ARRAY(Boolean)),
+        ).table_valued("id", "email", "username", "is_active").render_derived(name="changes")
+        
+        return (
+            update(User)
+            .where(User.id == rows.c.id)
+            .values(
+                email       = func.coalesce(rows.c.email, User.email),
+                username    = func.coalesce(rows.c.username, User.username),
+                is_active   = func.coalesce(rows.c.is_active, User.is_active),
+                updated_at  = func.now()
+            )
+            .returning(User.id)
+        )
+
+
+class AsyncUserService:
+
+    @staticmethod
+    async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
+        hashed_password = await password_hasher.hash(user_data.password)
+        try:
+            db_user = await db.scalar(UserService._create_user_stmt(user_data, hashed_password))
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise UserAlreadyExistsError(UserService._conflict_detail(e)) from e
+        return db_user
+
+    @staticmethod
+    async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
+        user = await user_cache.aget(user_id)
+        if user is None:
+            payload = await async_user_fetches.do(
+                (db.get_bind(), user_id), lambda: AsyncUserService._fetch_user_payload(db, user_id)
+            )
+            user    = UserCache.to_user(payload) if payload else None
+        return user
+
+    @staticmethod
+    async def _fetch_user_payload(db: AsyncSession, user_id: int) -> Optional[dict]:
+        user = await db.scalar(select(User).where(User.id == user_id))
+        if user is None:
+            return None
+        if is_primary_session(db):
+            await user_cache.astore(user)
+        return UserCache.to_payload(user)
+
+    @staticmethod
+    async def load_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
+        return await db.scalar(select(User).where(User.id == user_id))
+
+    @staticmethod
+    async def load_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+        return await db.scalar(select(User).where(User.email == email))
+
+    @staticmethod
+    async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+        user = await user_cache.alookup("email", email)
+        if user is None:
+            user = await db.scalar(select(User).where(User.email == email))
+            if user and is_primary_session(db):
+                await user_cache.astore(user)
+        return user
+
+    @staticmethod
+    async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
+        user = await user_cache.alookup("username", username)
+        if user is None:
+            user = await db.scalar(select(User).where(User.username == username))
+            if user and is_primary_session(db):
+                await user_cache.astore(user)
+        return user
+
+    @staticmethod
+    async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
+        return (await db.scalars(select(User).order_by(User.id).offset(skip).limit(limit))).all()
+
+    @staticmethod
+    async def get_users_after(db: AsyncSession, after_id: int, limit: int = 100) -> List[User]:
+        return (await db.scalars(select(User).where(User.id > after_id).order_by(User.id).limit(limit))).all()
+
+    @staticmethod
+    async def get_user_rows(db: AsyncSession, skip: int = 0, limit: int = 100) -> Sequence:
+        return (await db.execute(select(*USER_RESPONSE_COLUMNS).order_by(User.id).offset(skip).limit(limit))).all()
+
+    @staticmethod
+    async def get_user_rows_after(db: AsyncSession, after_id: int, limit: int = 100) -> Sequence:
+        return (await db.execute(
+            select(*USER_RESPONSE_COLUMNS).where(User.id > after_id).order_by(User.id).limit(limit)
+        )).all()
+
+    @staticmethod
+    async def export_users(fmt: ExportFormat) -> AsyncIterator[str]:
+        async with await open_async_read_session() as db:
+            result = await db.stream(
+                select(*EXPORT_COLUMNS)
+                .order_by(User.id)
+                .execution_options(yield_per=settings.USER_EXPORT_BATCH_SIZE)
+            )
+            if fmt == ExportFormat.CSV:
+                yield UserService._render_export_header()
+            async for rows in result.partitions():
+                yield UserService._render_export_rows(rows, fmt)
+
+    @staticmethod
+    async def update_user(
+        db                  : AsyncSession,
+        user_id             : int,
+        user_data           : UserUpdate,
+        expected_versions   : Optional[List[datetime]] = None
+    ) -> Optional[User]:
+        update_data = user_data.model_dump(exclude_unset=True)
+        if not update_data:
+            user = await db.get(User, user_id)
+            if user and expected_versions is not None and user.updated_at not in expected_versions:
+                raise UserVersionMismatchError()
+            return user
+
+        try:
+            user = await db.scalar(
+                UserService._update_user_stmt(user_id, update_data, expected_versions),
+                execution_options = {"synchronize_session": False}
+            )
+            if not user and expected_versions is not None and await db.scalar(select(User.id).where(User.id == user_id)):
+                await db.rollback()
+                raise UserVersionMismatchError()
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise UserAlreadyExistsError(UserService._conflict_detail(e)) from e
+
+        await user_cache.ainvalidate(user_id)
+        return user
+
+    @staticmethod
+    async def get_user_version(db: AsyncSession, user_id: int) -> Optional[datetime]:
+        user = await user_cache.aget(user_id)
+        if user is not None:
+            return user.updated_at
+        return await db.scalar(select(User.updated_at).where(User.id == user_id))
+
+    @staticmethod
+    async def delete_user(db: AsyncSession, user_id: int) -> bool:
+        user = await db.get(User, user_id)
+        if not user:
+            return False
+
+        await db.delete(user)
+        await db.commit()
+        await user_cache.ainvalidate(user_id)
+        return True
+
+    @staticmethod
+    async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+        user = await AsyncUserService.load_user_by_email(db, email)
+        if not user or not await password_hasher.verify(password, user.hashed_password):
             return None
-        return user
\ No newline at end of file
+        return user
+
+    @staticmethod
+    async def bulk_create_users(db: AsyncSession, users: List[BulkUserCreate]) -> BulkUserCreateResponse:
+        plain   = [index for index, user in enumerate(users) if user.password is not None]
+        hashes  = await password_hasher.hash_many([users[index].password for index in plain])
+        rows    = UserService._bulk_insert_rows(users, dict(zip(plain, hashes)))
+
+        response = BulkUserCreateResponse(created=[], conflicts=[])
+        for start in range(0, len(rows), settings.BULK_USER_CHUNK_SIZE):
+            chunk       = rows[start:start + settings.BULK_USER_CHUNK_SIZE]
+            inserted    = (await db.execute(UserService._bulk_insert_stmt(chunk))).all()
+            UserService._collect_bulk_results(start, chunk, inserted, response)
+
+        await db.commit()
+        return response
+
+    @staticmethod
+    async def bulk_update_users(db: AsyncSession, updates: List[BulkUserUpdate]) -> BulkUserUpdateResponse:
+        requested   = UserService._dedupe_updates(updates)
+        updated     = (await db.scalars(
+            UserService._bulk_update_stmt(requested),
+            execution_options = {"synchronize_session": False}
+        )).all()
+        await db.commit()
+
+        for user_id in updated:
+            await user_cache.ainvalidate(user_id)
+        return BulkUserUpdateResponse(
+            updated     = sorted(updated),
+            not_found   = sorted(set(requested) - set(updated))
+        )
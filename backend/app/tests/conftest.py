@@ -0,0 +1,81 @@
+"""
+Tests run against a real PostgreSQL server: the code under test relies on
+partitioning, ON CONFLICT and pg_trgm. Connection settings come from the
+environment or .env as for the app, but the database is TEST_POSTGRES_DB
+(default: POSTGRES_DB with a ``_test`` suffix). It is created if missing and
+migrated to head. Tests are skipped when the server cannot be reached.
+"""
+import os
+
+import pytest
+
+from app.core.config import settings
+
+# Before anything imports app.database, which builds its engines from settings.
+settings.POSTGRES_DB        = os.environ.get("TEST_POSTGRES_DB", f"{settings.POSTGRES_DB}_test")
+settings.DB_REPLICA_URLS    = []
+settings.USER_CACHE_BACKEND = "memory"
+
+TABLES = (
+    "login_attempts",
+    "login_attempt_hourly_by_email",
+    "login_attempt_hourly_by_ip",
+    "revoked_tokens",
+    "refresh_tokens",
+    "users",
+)
+
+
+def _create_database() -> None:
+    from sqlalchemy import create_engine, text
+
+    server = create_engine(
+        f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/postgres",
+        isolation_level = "AUTOCOMMIT"
+    )
+    try:
+        with server.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": settings.POSTGRES_DB}
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{settings.POSTGRES_DB}"'))
+    finally:
+        server.dispose()
+
+
+@pytest.fixture(scope="session")
+def engine():
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy.exc import OperationalError
+
+    try:
+        _create_database()
+    except OperationalError as e:
+        pytest.skip(f"PostgreSQL is not reachable: {e}")
+
+    from app.database import engine
+    from app.database.migrations import ALEMBIC_INI
+
+    command.upgrade(Config(str(ALEMBIC_INI)), "head")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """A primary session on emptied tables, with an empty user cache."""
+    from sqlalchemy import text
+    from app.database import SessionLocal
+    from app.services.user_cache import user_cache
+
+    with engine.begin() as conn:
+        conn.execute(text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"))
+    user_cache.backend.clear()
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
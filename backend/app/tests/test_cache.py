@@ -0,0 +1,144 @@
+import asyncio
+import time
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.cache import RedisCache
+from app.core.config import Settings
+from app.database.models.user_model import User
+from app.services.user_cache import UserCache
+
+
+class FakeRedis:
+    """In-memory stand-in for the part of ``redis.Redis`` that RedisCache uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and self.get(key) is not None:
+            return None
+        self.data[key] = (value.encode(), time.monotonic() + ex if ex else None)
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakeAsyncRedis:
+
+    def __init__(self, sync: FakeRedis):
+        self.sync = sync
+
+    async def get(self, key):
+        return self.sync.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        return self.sync.set(key, value, ex=ex, nx=nx)
+
+    async def delete(self, *keys):
+        self.sync.delete(*keys)
+
+
+@pytest.fixture
+def client():
+    return FakeRedis()
+
+
+def _cache(client) -> RedisCache:
+    return RedisCache(client, ttl_seconds=60, prefix="test:", async_client=FakeAsyncRedis(client))
+
+
+def _user(**overrides) -> User:
+    fields = dict(
+        id              = 1,
+        email           = "alice@example.com",
+        username        = "alice",
+        hashed_password = "bcrypt-hash",
+        is_active       = True,
+        is_superuser    = False,
+        created_at      = datetime(2026, 1, 1, tzinfo=timezone.utc),
+        updated_at      = None
+    )
+    fields.update(overrides)
+    return User(**fields)
+
+
+def test_redis_cache_round_trip_and_stats(client):
+    cache = _cache(client)
+
+    assert cache.get("a") is None
+    cache.set("a", {"value": 1})
+    assert cache.get("a") == {"value": 1}
+    assert not cache.add("a", {"value": 2})
+    assert cache.add("b", [1, 2])
+    cache.delete("a", "b")
+    assert cache.get("a") is None and cache.get("b") is None
+
+    assert client.data == {}
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 3, "evictions": 0}
+
+
+def test_redis_cache_async_methods(client):
+    cache = _cache(client)
+
+    async def scenario():
+        await cache.aset("a", "x")
+        assert await cache.aget("a") == "x"
+        assert not await cache.aadd("a", "y")
+        await cache.adelete("a")
+        assert await cache.aget("a") is None
+
+    asyncio.run(scenario())
+
+
+def test_invalidation_is_seen_by_every_worker(client):
+    # Two workers, each with its own UserCache, sharing one Redis.
+    first, second = UserCache(_cache(client)), UserCache(_cache(client))
+
+    first.store(_user())
+    assert second.get(1).username == "alice"
+    assert second.lookup("email", "alice@example.com").id == 1
+
+    second.invalidate(1)
+    assert first.get(1) is None
+    assert first.lookup("email", "alice@example.com") is None
+
+
+def test_stale_pointer_is_a_miss(client):
+    cache = UserCache(_cache(client))
+
+    cache.store(_user())
+    cache.store(_user(email="alice@example.org"))
+    assert cache.lookup("email", "alice@example.com") is None
+    assert cache.lookup("email", "alice@example.org").id == 1
+
+
+def test_password_hash_is_not_cached(client):
+    UserCache(_cache(client)).store(_user())
+    assert all(b"bcrypt-hash" not in value for value, _ in client.data.values())
+
+
+def _settings(**values) -> Settings:
+    return Settings(POSTGRES_DB="app", POSTGRES_USER="app", POSTGRES_PASSWORD="app", SECRET_KEY="secret", **values)
+
+
+def test_memory_user_cache_is_refused_with_several_workers():
+    with pytest.raises(ValidationError, match="USER_CACHE_BACKEND=memory"):
+        _settings(WEB_CONCURRENCY=4, USER_CACHE_BACKEND="memory")
+
+
+@pytest.mark.parametrize("workers, backend", [(1, "memory"), (4, "none")])
+def test_auto_user_cache_backend(workers, backend):
+    assert _settings(WEB_CONCURRENCY=workers, USER_CACHE_BACKEND="auto").USER_CACHE_BACKEND == backend
@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+from app.core import hashing
+from app.core.hashing import PasswordHasher
+
+CHUNK_SECONDS = 0.05
+
+
+def _slow_hash_passwords(passwords):
+    time.sleep(CHUNK_SECONDS)
+    return [f"hashed:{password}" for password in passwords]
+
+
+@pytest.fixture
+def hasher(monkeypatch):
+    monkeypatch.setattr(hashing, "hash_passwords", _slow_hash_passwords)
+    monkeypatch.setattr(hashing, "verify_password", lambda plain, hashed: hashed == f"hashed:{plain}")
+    hasher = PasswordHasher("thread", pool_size=2, queue_size=4, chunk_size=2)
+    yield hasher
+    hasher.shutdown()
+
+
+def test_bulk_hash_keeps_results_in_order(hasher):
+    passwords = [f"password{index}" for index in range(7)]
+    assert hasher.hash_many_sync(passwords) == [f"hashed:{password}" for password in passwords]
+
+
+def test_verify_completes_while_bulk_hash_is_in_flight(hasher):
+    passwords   = [f"password{index}" for index in range(40)]
+    bulk        = threading.Thread(target=hasher.hash_many_sync, args=(passwords,))
+    bulk.start()
+    try:
+        time.sleep(CHUNK_SECONDS / 2)
+        assert hasher._bulk_queue
+
+        started = time.perf_counter()
+        assert hasher.verify_sync("secret", "hashed:secret")
+        elapsed = time.perf_counter() - started
+
+        # 20 chunks on one bulk slot take a second; the verify takes at most one chunk.
+        assert bulk.is_alive()
+        assert elapsed < CHUNK_SECONDS * 3
+    finally:
+        bulk.join()
@@ -0,0 +1,114 @@
+import random
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, text, update
+
+from app.database.models.auth_model import LoginAttempt, LoginAttemptHourlyByEmail
+from app.services.login_stats_service import LoginStatsService
+
+EMAILS  = ("alice@example.com", "bob@example.com", "carol@example.com")
+IPS     = ("203.0.113.1", "203.0.113.2", "198.51.100.7")
+UNTIL   = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+SINCE   = UNTIL - timedelta(hours=30)
+
+BRUTE_FORCE = text(
+    "SELECT date_trunc('hour', attempted_at, 'UTC') AS bucket, "
+    "count(*) FILTER (WHERE success) AS successes, "
+    "count(*) FILTER (WHERE NOT success) AS failures "
+    "FROM login_attempts "
+    "WHERE attempted_at >= :since AND attempted_at < :until "
+    "AND (CAST(:email AS text) IS NULL OR email = :email) "
+    "AND (CAST(:ip AS text) IS NULL OR ip_address = :ip) "
+    "GROUP BY 1 ORDER BY 1"
+)
+
+
+def _attempts(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        {
+            "email"         : rng.choice(EMAILS),
+            "ip_address"    : rng.choice(IPS),
+            "success"       : rng.random() < 0.3,
+            "attempted_at"  : SINCE + timedelta(seconds=rng.randrange(int((UNTIL - SINCE).total_seconds())))
+        }
+        for _ in range(count)
+    ]
+
+
+def _write(engine, rows, batch_size: int = 97):
+    # What LoginAttemptWriter.flush does per batch; batches share hours, so
+    # rollup rows are incremented, not just inserted.
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        with engine.begin() as conn:
+            conn.execute(insert(LoginAttempt), batch)
+            LoginStatsService.apply_rollups(conn, batch)
+
+
+def _brute_force(db, email=None, ip=None):
+    rows = db.execute(BRUTE_FORCE, {"since": SINCE, "until": UNTIL, "email": email, "ip": ip})
+    return [(row.bucket, row.successes, row.failures) for row in rows]
+
+
+def _stats(db, email=None, ip=None):
+    response = LoginStatsService.get_stats(db, SINCE, UNTIL, email=email, ip=ip)
+    return [(bucket.bucket, bucket.successes, bucket.failures) for bucket in response.buckets]
+
+
+FILTERS = [{}] + [{"email": email} for email in EMAILS] + [{"ip": ip} for ip in IPS]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_rollups_match_brute_force_aggregate(engine, db, filters):
+    _write(engine, _attempts(2000))
+
+    expected = _brute_force(db, **filters)
+    assert expected
+    assert _stats(db, **filters) == expected
+
+
+def test_stats_totals_and_failure_rate(engine, db):
+    rows = _attempts(500)
+    _write(engine, rows)
+
+    response    = LoginStatsService.get_stats(db, SINCE, UNTIL)
+    successes   = sum(row["success"] for row in rows)
+    assert response.successes == successes
+    assert response.failures == len(rows) - successes
+    assert response.failure_rate == pytest.approx((len(rows) - successes) / len(rows))
+
+
+def test_backfill_rebuilds_rollups_from_raw_rows(engine, db):
+    _write(engine, _attempts(1000))
+    expected = _brute_force(db)
+
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE login_attempt_hourly_by_email, login_attempt_hourly_by_ip"))
+    assert _stats(db) == []
+
+    LoginStatsService.backfill(SINCE, UNTIL)
+    assert _stats(db) == expected
+    assert LoginStatsService.verify(SINCE, UNTIL) == []
+
+    # Replaces rather than adds, so a second run changes nothing.
+    LoginStatsService.backfill(SINCE, UNTIL)
+    assert _stats(db) == expected
+
+
+def test_verify_reports_drift(engine, db):
+    _write(engine, _attempts(300))
+    assert LoginStatsService.verify(SINCE, UNTIL) == []
+
+    with engine.begin() as conn:
+        conn.execute(
+            update(LoginAttemptHourlyByEmail)
+            .where(LoginAttemptHourlyByEmail.email == EMAILS[0])
+            .values(failures=LoginAttemptHourlyByEmail.failures + 1)
+        )
+
+    mismatches = LoginStatsService.verify(SINCE, UNTIL)
+    assert mismatches
+    assert all("login_attempt_hourly_by_email" in line and EMAILS[0] in line for line in mismatches)
@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import insert, text
+
+from app.core.config import settings
+from app.database.models.user_model import User
+from app.services.user_search_service import UserSearchService
+from app.utils.pagination import encode_search_cursor, decode_search_cursor
+
+PEOPLE = ("alice", "alicia", "malice", "al_ice", "bob")
+
+
+def _create_users(db, usernames):
+    db.execute(insert(User), [
+        {"email": f"{name}@example.com", "username": name, "hashed_password": "x", "is_active": True, "is_superuser": False}
+        for name in usernames
+    ])
+    db.commit()
+
+
+def _search(db, query, limit=20, after=None):
+    return UserSearchService.search_users(db, query, limit=limit, after=after)
+
+
+def _search_all_pages(db, query, page_size):
+    """Follow cursors the way a client would, through their encoded form."""
+    rows, cursor = [], None
+    while True:
+        after   = decode_search_cursor(cursor) if cursor else None
+        page    = _search(db, query, limit=page_size, after=after)
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        cursor  = encode_search_cursor(page[-1].score, page[-1].id)
+
+
+@pytest.fixture
+def trigram(db, monkeypatch):
+    if not db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).scalar():
+        pytest.skip("pg_trgm is not installed in the test database")
+    monkeypatch.setattr(settings, "USER_SEARCH_BACKEND", "trigram")
+
+
+@pytest.fixture
+def prefix(monkeypatch):
+    monkeypatch.setattr(settings, "USER_SEARCH_BACKEND", "prefix")
+
+
+def test_trigram_ranks_exact_then_prefix_then_fuzzy(db, trigram):
+    _create_users(db, ("alice", "alicia", "malice", "bob"))
+
+    rows = _search(db, "Alice")
+    assert [row.username for row in rows] == ["alice", "alicia", "malice"]
+    assert rows[0].score > rows[1].score > 1.0 > rows[2].score > 0.0
+
+
+def test_trigram_short_query_uses_prefix_match(db, trigram):
+    _create_users(db, PEOPLE)
+
+    rows = _search(db, "al")
+    assert [row.username for row in rows] == ["alice", "alicia", "al_ice"]
+    assert {row.score for row in rows} == {1.0}
+
+
+def test_prefix_fallback_matches_prefixes_only(db, prefix):
+    _create_users(db, PEOPLE)
+
+    rows = _search(db, "alice")
+    assert [row.username for row in rows] == ["alice"]
+    assert [row.username for row in _search(db, "ali")] == ["alice", "alicia"]
+    assert _search(db, "lice") == []
+
+
+def test_like_wildcards_in_query_are_literal(db, prefix):
+    _create_users(db, PEOPLE)
+
+    assert [row.username for row in _search(db, "al_")] == ["al_ice"]
+    assert _search(db, "%") == []
+
+
+@pytest.mark.parametrize("backend", ["trigram", "prefix"])
+def test_keyset_pages_cover_results_once_in_order(db, monkeypatch, backend):
+    if backend == "trigram" and not db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).scalar():
+        pytest.skip("pg_trgm is not installed in the test database")
+    monkeypatch.setattr(settings, "USER_SEARCH_BACKEND", backend)
+    # Equal-length names score the same, so most of the order comes from the id tie-break.
+    _create_users(db, [f"user{index:03d}" for index in range(23)] + ["user_long_name", "username"])
+
+    expected    = _search(db, "user", limit=100)
+    paged       = _search_all_pages(db, "user", page_size=4)
+
+    assert len(expected) == 25
+    assert [row.id for row in paged] == [row.id for row in expected]
+    assert [(row.score, row.id) for row in paged] == sorted(((row.score, row.id) for row in paged), key=lambda key: (-key[0], key[1]))
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def user_etag(user_id: int, updated_at: datetime) -> str:
+    """Strong ETag for a user row: its id plus updated_at in integer microseconds."""
+    micros = (updated_at - EPOCH) // timedelta(microseconds=1)
+    return f'"{user_id}-{micros}"'
+
+def _split(header: str) -> List[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+def etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, so ``W/`` prefixes are ignored)."""
+    tags = _split(header)
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+def parse_user_etags(header: str, user_id: int) -> Optional[List[datetime]]:
+    """
+    Versions named by an If-Match header for ``user_id``. Returns None for
+    ``*`` (any version); an empty list means no tag can match this user.
+    """
+    tags = _split(header)
+    if "*" in tags:
+        return None
+
+    versions = []
+    for tag in tags:
+        # If-Match uses strong comparison: weak tags never match.
+        if tag.startswith("W/") or len(tag) < 2 or tag[0] != '"' or tag[-1] != '"':
+            continue
+        tag_user_id, _, micros = tag[1:-1].partition("-")
+        if tag_user_id == str(user_id) and micros.isdigit():
+            versions.append(EPOCH + timedelta(microseconds=int(micros)))
+    return versions
@@ -0,0 +1,45 @@
+import base64
+import json
+
+from typing import Tuple
+
+
+def _encode(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def _decode(cursor: str) -> dict:
+    try:
+        padded  = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def encode_cursor(last_id: int) -> str:
+    return _encode({"id": last_id})
+
+def decode_cursor(cursor: str) -> int:
+    """Return the last seen id encoded in an opaque cursor, or raise ValueError."""
+    last_id = _decode(cursor).get("id")
+    if not _is_int(last_id):
+        raise ValueError("Invalid cursor")
+    return last_id
+
+def encode_search_cursor(score: float, last_id: int) -> str:
+    return _encode({"score": score, "id": last_id})
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """Return the (score, id) of the last seen search result, or raise ValueError."""
+    payload = _decode(cursor)
+    score   = payload.get("score")
+    last_id = payload.get("id")
+    if not _is_int(last_id) or not (_is_int(score) or isinstance(score, float)):
+        raise ValueError("Invalid cursor")
+    return float(score), last_id
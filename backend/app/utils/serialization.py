@@ -0,0 +1,33 @@
+from typing import Iterable, List
+
+import orjson
+
+from fastapi.responses import ORJSONResponse
+
+from app.database.models.user_model import User
+
+# Columns of UserResponse, in its field order. Selecting only these skips ORM
+# entity construction and the identity map for read-only list endpoints.
+USER_RESPONSE_COLUMNS = (
+    User.email,
+    User.username,
+    User.is_active,
+    User.id,
+    User.is_superuser,
+    User.created_at,
+    User.updated_at,
+)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson-rendered response whose output matches FastAPI's default encoding of our schemas."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+
+
+def user_to_dict(user: User) -> dict:
+    return {column.key: getattr(user, column.key) for column in USER_RESPONSE_COLUMNS}
+
+def rows_to_dicts(rows: Iterable) -> List[dict]:
+    return [row._asdict() for row in rows]
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from app.core.metrics import SINGLEFLIGHT_CALLS
+
+
+class _Call:
+
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result : Any = None
+        self.error  : Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls for the same key into one execution: the
+    first caller runs ``fn`` and every caller that arrives while it is
+    running blocks and receives the same result (or exception). Nothing is
+    kept once the call finishes, so this is not a cache. For threadpool
+    (sync) callers; see ``AsyncSingleFlight`` for coroutines.
+    """
+
+    def __init__(self, name: str):
+        self.name   = name
+        self._calls : Dict[Hashable, _Call] = {}
+        self._lock  = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call    = self._calls.get(key)
+            leader  = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            SINGLEFLIGHT_CALLS.labels(self.name, "coalesced").inc()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        SINGLEFLIGHT_CALLS.labels(self.name, "executed").inc()
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    ``SingleFlight`` for coroutines on one event loop. ``fn`` runs in the
+    leader's own task, so it may use the leader's resources (such as its
+    database session) and is cancelled together with the leader. Waiters of
+    a cancelled leader retry, the first of them becoming the new leader.
+    """
+
+    def __init__(self, name: str):
+        self.name   = name
+        self._calls : Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while (call := self._calls.get(key)) is not None:
+            SINGLEFLIGHT_CALLS.labels(self.name, "coalesced").inc()
+            try:
+                # Shielded so a cancelled waiter does not cancel the shared future.
+                return await asyncio.shield(call)
+            except asyncio.CancelledError:
+                if not call.cancelled():
+                    raise
+
+        SINGLEFLIGHT_CALLS.labels(self.name, "executed").inc()
+        call = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            # Marks the exception retrieved when nobody was waiting for it.
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
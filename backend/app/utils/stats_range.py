@@ -0,0 +1,16 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+
+def as_utc(moment: datetime) -> datetime:
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment
+
+def resolve_stats_range(since: Optional[datetime], until: Optional[datetime], max_hours: int) -> Tuple[datetime, datetime]:
+    """Fill in a default last-24-hours range, treating naive times as UTC; raise ValueError for bad ranges."""
+    until = as_utc(until) if until is not None else datetime.now(timezone.utc)
+    since = as_utc(since) if since is not None else until - timedelta(hours=24)
+    if since >= until:
+        raise ValueError("since must be before until")
+    if until - since > timedelta(hours=max_hours):
+        raise ValueError(f"Range is limited to {max_hours} hours")
+    return since, until
@@ -0,0 +1,101 @@
+"""
+Cold start of the backend: import time of ``main`` and time from process
+spawn to the first ``GET /health`` response. Each run is a fresh interpreter.
+The migration check is off by default, so no database is needed. Run from
+``backend/``:
+
+    python -m benchmarks.bench_cold_start [--runs 5] [--top 15]
+
+``--top`` lists the slowest imports (cumulative, from ``-X importtime``).
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BENCH_ENV = {
+    "POSTGRES_DB"           : "bench",
+    "POSTGRES_USER"         : "bench",
+    "POSTGRES_PASSWORD"     : "bench",
+    "SECRET_KEY"            : "bench",
+    "DB_VERIFY_MIGRATIONS"  : "false",
+}
+
+
+def bench_env() -> dict:
+    env = dict(os.environ)
+    for key, value in BENCH_ENV.items():
+        env.setdefault(key, value)
+    return env
+
+
+def import_seconds(env: dict) -> float:
+    code    = "import time; started = time.perf_counter(); import main; print(time.perf_counter() - started)"
+    output  = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(env: dict, top: int) -> list:
+    output  = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], env=env, check=True, capture_output=True, text=True)
+    rows    = []
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), module.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def first_response_seconds(env: dict, timeout: float = 30.0) -> float:
+    port    = free_port()
+    url     = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    server  = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        env     = env,
+        stdout  = subprocess.DEVNULL,
+        stderr  = subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"no response from {url} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args    = parser.parse_args()
+    env     = bench_env()
+
+    imports     = [import_seconds(env) for _ in range(args.runs)]
+    responses   = [first_response_seconds(env) for _ in range(args.runs)]
+    print(f"import main          median {statistics.median(imports) * 1000:8.1f} ms  (runs={args.runs})")
+    print(f"first /health        median {statistics.median(responses) * 1000:8.1f} ms  (runs={args.runs})")
+
+    print("\nslowest imports (cumulative):")
+    for cumulative, module in slowest_imports(env, args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Cost of logging on the request path: text sinks (formatted and written by the
+calling thread) against the queued JSON writer. Logs ``--records`` access-log
+style records, bound like ``AccessLogMiddleware`` does, and reports the time
+each call adds (p50/p99) and the overall throughput including the drain.
+Console output goes to /dev/null; files go to a temporary directory. Run from
+``backend/``:
+
+    python -m benchmarks.bench_logging [--records 100000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("POSTGRES_DB", "bench")
+os.environ.setdefault("POSTGRES_USER", "bench")
+os.environ.setdefault("POSTGRES_PASSWORD", "bench")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from app.core import logger as logging_setup
+
+
+def run(log_format: str, records: int):
+    stdout      = sys.stdout
+    sys.stdout  = open(os.devnull, "w")
+    try:
+        with tempfile.TemporaryDirectory() as log_dir:
+            logger = logging_setup.setup_logging(log_format=log_format, log_dir=log_dir)
+            bound  = logger.bind(route="/api/v1/users/{user_id}", method="GET", path="/api/v1/users/42", status=200, duration_ms=1.23)
+
+            latencies   = []
+            started     = time.perf_counter()
+            for _ in range(records):
+                call_started = time.perf_counter()
+                bound.info("GET /api/v1/users/42 200 1.23ms")
+                latencies.append(time.perf_counter() - call_started)
+
+            dropped = logging_setup._writer.dropped if logging_setup._writer is not None else 0
+            logging_setup.shutdown_logging()
+            logger.remove()
+            elapsed = time.perf_counter() - started
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    latencies.sort()
+    return {
+        "p50_us"    : statistics.median(latencies) * 1e6,
+        "p99_us"    : latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+        "per_sec"   : records / elapsed,
+        "dropped"   : dropped,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'format':<8} {'p50 (us)':>10} {'p99 (us)':>10} {'records/s':>12} {'dropped':>9}")
+    for log_format in ("text", "json"):
+        result = run(log_format, args.records)
+        print(f"{log_format:<8} {result['p50_us']:>10.1f} {result['p99_us']:>10.1f} {result['per_sec']:>12.0f} {result['dropped']:>9}")
+
+
+if __name__ == "__main__":
+    main()
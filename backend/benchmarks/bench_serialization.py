@@ -0,0 +1,72 @@
+"""
+Response serialization cost of the default path versus FAST_SERIALIZATION.
+
+"default" mirrors what FastAPI does for ``response_model=List[UserResponse]``:
+validate ORM objects with ``from_attributes``, dump to JSON-compatible Python,
+then ``json.dumps``. "fast" serializes column rows (as returned by
+``UserService.get_user_rows``) with orjson. Database time is not included. Run
+from ``backend/``:
+
+    python -m benchmarks.bench_serialization
+"""
+import json
+import os
+import timeit
+
+from datetime import datetime, timezone
+from typing import List
+
+os.environ.setdefault("POSTGRES_DB", "bench")
+os.environ.setdefault("POSTGRES_USER", "bench")
+os.environ.setdefault("POSTGRES_PASSWORD", "bench")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from pydantic import TypeAdapter
+
+from app.database.models.user_model import User
+from app.database.schemas.user_schema import UserResponse
+from app.utils.serialization import FastJSONResponse, user_to_dict
+
+users_adapter = TypeAdapter(List[UserResponse])
+
+
+def make_users(count: int) -> List[User]:
+    now = datetime.now(timezone.utc)
+    return [
+        User(
+            id              = i,
+            email           = f"user{i}@example.com",
+            username        = f"user{i}",
+            hashed_password = "x" * 60,
+            is_active       = True,
+            is_superuser    = False,
+            created_at      = now,
+            updated_at      = now
+        )
+        for i in range(count)
+    ]
+
+
+def default_path(users: List[User]) -> bytes:
+    content = users_adapter.dump_python(users_adapter.validate_python(users, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def fast_path(rows: List[dict]) -> bytes:
+    return FastJSONResponse(rows).body
+
+
+def main():
+    print(f"{'size':>6} {'default (us)':>14} {'fast (us)':>12} {'speedup':>8}")
+    for size in (1, 100, 1000):
+        users   = make_users(size)
+        rows    = [user_to_dict(user) for user in users]
+        number  = max(10, 20000 // size)
+
+        default = min(timeit.repeat(lambda: default_path(users), number=number, repeat=5)) / number
+        fast    = min(timeit.repeat(lambda: fast_path(rows), number=number, repeat=5)) / number
+        print(f"{size:>6} {default * 1e6:>14.1f} {fast * 1e6:>12.1f} {default / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+User search latency against a local database, for both search backends.
+Seeds ``--users`` rows (usernames/emails prefixed ``searchbench``) with one
+multi-row INSERT per batch, times each query, prints the plan's access
+path, and removes the seeded rows afterwards. Needs ``alembic upgrade head``
+first. Run from ``backend/``:
+
+    python -m benchmarks.bench_user_search [--users 200000] [--runs 20]
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("POSTGRES_DB", "backend_db")
+os.environ.setdefault("POSTGRES_USER", "backend_user")
+os.environ.setdefault("POSTGRES_PASSWORD", "backend_pass_2025")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from sqlalchemy import delete, insert
+
+from app.database import SessionLocal
+from app.database.models.user_model import User
+from app.services.user_search_service import UserSearchService
+
+PREFIX  = "searchbench"
+QUERIES = ("se", "searchbench12", "serchbench1234", "searchbench99999@example")
+
+
+def seed(count: int, batch: int = 5000) -> None:
+    with SessionLocal() as db:
+        for start in range(0, count, batch):
+            db.execute(insert(User), [
+                {
+                    "email"             : f"{PREFIX}{i}@example.com",
+                    "username"          : f"{PREFIX}{i}",
+                    "hashed_password"   : "x" * 60,
+                    "is_active"         : True,
+                    "is_superuser"      : False
+                }
+                for i in range(start, min(start + batch, count))
+            ])
+        db.commit()
+        db.connection().exec_driver_sql("ANALYZE users")
+        db.commit()
+
+
+def cleanup() -> None:
+    with SessionLocal() as db:
+        db.execute(delete(User).where(User.username.like(f"{PREFIX}%")))
+        db.commit()
+
+
+def bench(query: str, backend: str, runs: int) -> None:
+    stmt    = UserSearchService._search_stmt(query, limit=20, backend=backend)
+    timings = []
+    with SessionLocal() as db:
+        for _ in range(runs):
+            started = time.perf_counter()
+            rows    = db.execute(stmt).all()
+            timings.append(time.perf_counter() - started)
+        compiled    = stmt.compile(dialect=db.bind.dialect)
+        plan        = db.connection().exec_driver_sql(f"EXPLAIN {compiled}", compiled.params).scalars().all()
+
+    scans = [line.strip() for line in plan if "Scan" in line]
+    print(f"{backend:8} {query!r:28} rows={len(rows):3}  median {statistics.median(timings) * 1000:7.2f} ms  {scans[0] if scans else ''}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    seed(args.users)
+    try:
+        for backend in ("trigram", "prefix"):
+            for query in QUERIES:
+                bench(query, backend, args.runs)
+    finally:
+        cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+#!/bin/sh
+# Migrate before serving; RUN_MIGRATIONS=false when migrations run as a
+# separate release step.
+set -e
+
+if [ "${RUN_MIGRATIONS:-true}" = "true" ]; then
+    python -m app.commands.migrate
+fi
+
+exec "$@"
@@ -0,0 +1,89 @@
+"""
+Production launcher: ``gunicorn -c gunicorn.conf.py main:app``
+
+Forks one uvicorn worker per core (up to 8) by default, but never more
+workers than DB_MAX_CONNECTIONS can give a connection each; an explicit
+WEB_CONCURRENCY beyond that refuses to start. WEB_CONCURRENCY is exported
+before the app is imported, so Settings can size each worker's connection
+pool against DB_MAX_CONNECTIONS.
+
+``kill -HUP <master>`` replaces workers gracefully. With the app preloaded,
+HUP keeps the code the master imported; deploy new code with
+``kill -USR2 <master>`` followed by ``kill -QUIT <old master>``, or run
+with GUNICORN_PRELOAD=false so HUP re-imports it.
+"""
+import multiprocessing
+import os
+import shutil
+import sys
+
+from decouple import config
+
+# Default: one worker per core, but at most 8. The default DB_MAX_CONNECTIONS
+# (100, 10 reserved) still gives 8 workers a pool of 11, or 5 per pool in
+# async mode; set WEB_CONCURRENCY explicitly to go beyond.
+DEFAULT_MAX_WORKERS = 8
+
+def max_workers_for_connection_budget():
+    # Read like Settings does (environment, then .env), without importing the
+    # app: its pools must be sized for the final WEB_CONCURRENCY.
+    budget  = config("DB_MAX_CONNECTIONS", default=100, cast=int)
+    if not budget:
+        return None
+    usable  = budget - config("DB_RESERVED_CONNECTIONS", default=10, cast=int)
+    pools   = 2 if config("DB_ASYNC", default=False, cast=bool) else 1
+    return max(usable // pools, 0)
+
+budget_workers = max_workers_for_connection_budget()
+
+if "WEB_CONCURRENCY" in os.environ:
+    workers = int(os.environ["WEB_CONCURRENCY"])
+    if budget_workers is not None and workers > budget_workers:
+        raise RuntimeError(
+            f"WEB_CONCURRENCY={workers} exceeds the connection budget: DB_MAX_CONNECTIONS allows at most "
+            f"{budget_workers} workers. Lower WEB_CONCURRENCY or raise DB_MAX_CONNECTIONS"
+        )
+else:
+    workers = min(multiprocessing.cpu_count(), DEFAULT_MAX_WORKERS)
+    if budget_workers is not None:
+        workers = min(workers, budget_workers)
+    if workers < 1:
+        raise RuntimeError("DB_MAX_CONNECTIONS leaves no connection for a worker; raise it or lower DB_RESERVED_CONNECTIONS")
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+
+worker_class        = "uvicorn.workers.UvicornWorker"
+bind                = f"{os.environ.get('API_HOST', '0.0.0.0')}:{os.environ.get('API_PORT', '8000')}"
+
+# Importing once in the master shares the loaded modules copy-on-write and
+# makes worker startup a fork instead of a full import.
+preload_app         = os.environ.get("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes")
+
+timeout             = int(os.environ.get("GUNICORN_TIMEOUT", "60"))
+graceful_timeout    = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive           = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+max_requests        = int(os.environ.get("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+def on_starting(server):
+    # Metric files left by a previous run would be summed into this one.
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory and os.path.isdir(directory):
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            shutil.rmtree(path) if os.path.isdir(path) else os.remove(path)
+
+def post_fork(server, worker):
+    # The preloaded master's JSON log writer thread does not survive the fork.
+    if "app.core.logger" in sys.modules:
+        from app.core.logger import restart_logging_after_fork
+        restart_logging_after_fork()
+
+    # A preloaded master may already hold pooled connections; the worker
+    # must never reuse those sockets.
+    if "app.database" in sys.modules:
+        from app.database import reset_engines_after_fork
+        reset_engines_after_fork()
+
+def child_exit(server, worker):
+    from app.core.metrics import mark_worker_dead
+    mark_worker_dead(worker.pid)
@@ -1,21 +1,71 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+import math
+
+import anyio
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.logger import logger
+from app.core.hashing import password_hasher, HashingOverloadedError
+from app.core.rate_limit import LoginThrottledError
+from app.services.login_attempt_writer import login_attempt_writer
+from app.services.maintenance_service import run_maintenance_loop
+from app.services.token_revocation import revocation_list
+from app.core.metrics import CONTENT_TYPE_LATEST, render_metrics, sample_pool_metrics
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.access_log import AccessLogMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
+from app.middleware.admission import AdmissionControlMiddleware, AdmissionGroup
+from app.middleware.idempotency import IdempotencyMiddleware
+from app.core.cache import create_cache
 from app.routes.v1.router import router
-from app.database.models import Base
-from app.database import engine
+from app.database import engine, async_engine, replicas
+from app.database.migrations import verify_migration_head
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Application ...")
     
-    logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created successfully")
+    if settings.DB_VERIFY_MIGRATIONS:
+        verify_migration_head()
+        logger.info("Database schema is at the latest migration")
+
+    # A sync handler holding a thread beyond what the DB pool can serve only
+    # queues inside SQLAlchemy; keep the two limits aligned.
+    threadpool_size = settings.THREADPOOL_SIZE or settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+
+    # Each worker counts on its own, so N workers let N times the limit through.
+    if settings.LOGIN_THROTTLE_ENABLED and settings.LOGIN_THROTTLE_BACKEND == "memory" and settings.WEB_CONCURRENCY > 1:
+        logger.warning(
+            f"LOGIN_THROTTLE_BACKEND=memory is per worker: with WEB_CONCURRENCY={settings.WEB_CONCURRENCY} "
+            f"a client gets up to {settings.WEB_CONCURRENCY}x the login limits. Use redis to enforce them exactly"
+        )
+
+    # In the worker, not at import: a preloaded master must not own gauge files.
+    sample_pool_metrics()
+
+    login_attempt_writer.start()
+    revocation_list.start()
+
+    maintenance = None
+    if settings.MAINTENANCE_ENABLED:
+        maintenance = asyncio.create_task(run_maintenance_loop(settings.MAINTENANCE_INTERVAL_SECONDS))
     
     yield
     logger.info("Shutting Application ...")
+    if maintenance is not None:
+        maintenance.cancel()
+    revocation_list.stop()
+    login_attempt_writer.stop()
+    password_hasher.shutdown()
+    await async_engine.dispose()
+    engine.dispose()
+    await replicas.dispose_async()
+    replicas.dispose()
 
 app = FastAPI(
     lifespan    = lifespan,
@@ -23,6 +73,80 @@ app = FastAPI(
     version     = settings.VERSION
 )
 
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        slow_threshold_ms   = settings.SLOW_REQUEST_THRESHOLD_MS,
+        max_statements      = settings.PROFILING_SLOWEST_STATEMENTS,
+        private_prefixes    = settings.PROFILING_PRIVATE_PREFIXES
+    )
+
+if settings.ADMISSION_CONTROL_ENABLED:
+    queue_timeout = settings.ADMISSION_QUEUE_TIMEOUT_MS / 1000
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        groups              = {
+            "/api/v1/auths" : AdmissionGroup("auth", settings.ADMISSION_AUTH_CONCURRENCY, settings.ADMISSION_AUTH_QUEUE_SIZE, queue_timeout),
+            "/api/v1/users" : AdmissionGroup("users", settings.ADMISSION_USERS_CONCURRENCY, settings.ADMISSION_USERS_QUEUE_SIZE, queue_timeout),
+        },
+        retry_after_seconds = settings.ADMISSION_RETRY_AFTER_SECONDS
+    )
+
+# Outside admission control, so replays never wait for a slot.
+if settings.IDEMPOTENCY_ENABLED:
+    app.add_middleware(
+        IdempotencyMiddleware,
+        store               = create_cache(
+            settings.IDEMPOTENCY_BACKEND,
+            max_size    = settings.IDEMPOTENCY_MAX_KEYS,
+            ttl_seconds = settings.IDEMPOTENCY_TTL_SECONDS,
+            prefix      = "idempotency:"
+        ),
+        lock_seconds        = settings.IDEMPOTENCY_LOCK_SECONDS,
+        max_body_bytes      = settings.IDEMPOTENCY_MAX_BODY_BYTES,
+        max_response_bytes  = settings.IDEMPOTENCY_MAX_RESPONSE_BYTES,
+        excluded_paths      = settings.IDEMPOTENCY_EXCLUDED_PATHS
+    )
+
+if replicas:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window_seconds      = settings.DB_READ_YOUR_WRITES_SECONDS
+    )
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+# Outermost, so shed and replayed requests are logged too. Replaces uvicorn's
+# access log, which has no route template to sample on.
+if settings.ACCESS_LOG_ENABLED:
+    app.add_middleware(AccessLogMiddleware)
+    logging.getLogger("uvicorn.access").disabled = True
+
+@app.exception_handler(HashingOverloadedError)
+async def hashing_overloaded_handler(request: Request, exc: HashingOverloadedError):
+    return JSONResponse(
+        status_code = status.HTTP_503_SERVICE_UNAVAILABLE,
+        content     = {"detail": "Server is busy, please retry shortly"},
+        headers     = {"Retry-After": "1"}
+    )
+
+@app.exception_handler(LoginThrottledError)
+async def login_throttled_handler(request: Request, exc: LoginThrottledError):
+    return JSONResponse(
+        status_code = status.HTTP_429_TOO_MANY_REQUESTS,
+        content     = {"detail": "Too many login attempts"},
+        headers     = {"Retry-After": str(math.ceil(exc.retry_after))}
+    )
+
+@app.get("/health", include_in_schema=False)
+async def health():
+    return {"status": "healthy"}
+
 app.include_router(
     router 
     , prefix   = "/api/v1"
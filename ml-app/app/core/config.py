@@ -13,7 +13,12 @@ class Settings(BaseSettings):
     MODEL_NAME      : str = Field(default="google/vit-base-patch16-224", description="Hugging Face model name")
     MAX_IMAGE_SIZE  : int = Field(default=224, description="Maximum image size for processing")
     
-    LOG_LEVEL       : str = Field(default="INFO", description="Log level")
+    LOG_LEVEL          : str = Field(default="INFO", description="Log level")
+    LOG_FORMAT         : str = Field(default="text", description="text, or json for structured lines written by a background thread")
+    LOG_DIR            : str = Field(default="logs", description="Directory for log files")
+    LOG_RETENTION_DAYS : int = Field(default=30, description="Days of daily log files kept")
+    LOG_QUEUE_SIZE     : int = Field(default=10000, description="Records buffered for the JSON writer; INFO and below are dropped beyond this")
+    LOG_BATCH_SIZE     : int = Field(default=512, description="Most records the JSON writer renders per write")
     
     class Config:
         env_file                = ".env"
@@ -1,9 +1,19 @@
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
+import threading
+import traceback
 
+from datetime import date, timedelta
 from pathlib import Path
+from typing import Callable, List, Optional
 from loguru import logger
 
+from app.core.config import settings
+
 class InterceptHandler(logging.Handler):
 
     def emit(self, record):
@@ -30,50 +40,219 @@ def get_status_color(status_code: int) -> str:
         return "<green>"
     else:
         return "<white>"
-    
+
 
 def color_status_code(status_code: int) -> str:
     color = get_status_color(status_code)
     return f"{color}{status_code}</>"
 
-def setup_logging():
-    log_dir = Path("logs")
+WARNING_NO = 30
+
+def render_json(record) -> str:
+    data = {
+        "time"      : record["time"].isoformat(),
+        "level"     : record["level"].name,
+        "logger"    : record["name"],
+        "function"  : record["function"],
+        "line"      : record["line"],
+        "message"   : record["message"],
+    }
+    data.update(record["extra"])
+    if record["exception"] is not None:
+        data["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    return json.dumps(data, default=str) + "\n"
+
+
+class DailyLogFile:
+    """Appends to ``<stem>-YYYY-MM-DD.jsonl``, switching files at midnight and deleting those older than ``retention_days``."""
+
+    def __init__(self, directory: Path, stem: str, retention_days: int):
+        self.directory      = directory
+        self.stem           = stem
+        self.retention_days = retention_days
+        self._day           : Optional[date] = None
+        self._file          = None
+
+    def write(self, text: str) -> None:
+        today = date.today()
+        if today != self._day:
+            self.close()
+            self._day   = today
+            self._file  = open(self.directory / f"{self.stem}-{today.isoformat()}.jsonl", "a", encoding="utf-8")
+            self._prune(today)
+        self._file.write(text)
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _prune(self, today: date) -> None:
+        oldest = (today - timedelta(days=self.retention_days)).isoformat()
+        for path in self.directory.glob(f"{self.stem}-*.jsonl"):
+            if path.stem[len(self.stem) + 1:] < oldest:
+                path.unlink(missing_ok=True)
+
+
+class QueuedLogWriter:
+    """
+    Loguru sink that hands records to a bounded queue; a background thread
+    renders them and writes each batch to every target with a single write
+    call. When the queue is full, records below WARNING are dropped at once
+    and WARNING and above wait up to ``block_seconds`` for room before being
+    dropped too; ``dropped`` counts both, so a stuck target cannot hang the
+    application.
+
+    The thread belongs to the process that started it. A forked server
+    worker calls ``restart_after_fork``; any other forked child (such as a
+    bcrypt pool process) writes its records directly, without a thread.
+    """
+
+    _STOP = object()
+
+    def __init__(self, targets: List, render: Callable, queue_size: int, batch_size: int, block_seconds: float = 1.0):
+        self.targets        = targets
+        self.render         = render
+        self.batch_size     = batch_size
+        self.queue_size     = queue_size
+        self.block_seconds  = block_seconds
+        self.dropped        = 0
+        self._start()
+
+    def _start(self) -> None:
+        self._pid       = os.getpid()
+        self._queue     = queue.Queue(maxsize=self.queue_size)
+        self._thread    = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def __call__(self, message) -> None:
+        record = message.record
+        if os.getpid() != self._pid:
+            self._write([record])
+            return
+        try:
+            if record["level"].no >= WARNING_NO:
+                self._queue.put(record, timeout=self.block_seconds)
+            else:
+                self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def restart_after_fork(self) -> None:
+        """Threads do not survive fork; a forked worker gets its own queue and writer thread."""
+        self._start()
+
+    def stop(self) -> None:
+        self._queue.put(self._STOP)
+        self._thread.join()
+        for target in self.targets:
+            if hasattr(target, "close"):
+                target.close()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = any(record is self._STOP for record in batch)
+            self._write([record for record in batch if record is not self._STOP])
+            if stopping:
+                return
+
+    def _write(self, records: List) -> None:
+        text = "".join(self.render(record) for record in records)
+        if not text:
+            return
+        for target in self.targets:
+            try:
+                target.write(text)
+                target.flush()
+            except Exception:
+                # Logging from here would re-enter this queue.
+                traceback.print_exc(file=sys.stderr)
+
+
+_writer     : Optional[QueuedLogWriter] = None
+_configured = False
+
+def shutdown_logging() -> None:
+    """Drain and stop the JSON writer thread, if one is running."""
+    global _writer
+    if _writer is not None:
+        logger.remove()
+        _writer.stop()
+        _writer = None
+
+def restart_logging_after_fork() -> None:
+    """Give a forked server worker its own JSON writer thread; called from gunicorn's post_fork."""
+    if _writer is not None:
+        _writer.restart_after_fork()
+
+def setup_logging(log_format: Optional[str] = None, log_dir: Optional[str] = None):
+    """
+    Configure loguru once per process; later calls without arguments return
+    the configured logger. ``log_format`` (text or json) and ``log_dir``
+    default to LOG_FORMAT and LOG_DIR.
+    """
+    global _writer, _configured
+    if _configured and log_format is None and log_dir is None:
+        return logger
+
+    log_format  = log_format or settings.LOG_FORMAT
+    log_dir     = Path(log_dir or settings.LOG_DIR)
     log_dir.mkdir(exist_ok=True)
 
     logging.root.handlers   = []
 
-    log_format  = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>"
-    )
-
+    shutdown_logging()
     logger.remove()
-    logger.add(sys.stdout, format=log_format, colorize=True, diagnose=False, catch=True)
-
-    # Current
-    logger.add(
-        log_dir / "app.log"
-        , format=log_format
-        , level ="DEBUG"
-        , colorize=True
-        , catch =True
-    )
-
-    # On backup
-    logger.add(
-        log_dir / "app-{time:DD-MM-YY}.log"
-        , format        =log_format
-        , rotation      ="00:00"
-        , retention     ="30 days"
-        , compression   ="zip"
-        , level         ="DEBUG"
-        , colorize      =True
-        , catch         =True
-        , backtrace     = True
-
-    )
+
+    if log_format == "json":
+        _writer = QueuedLogWriter(
+            targets     = [sys.stdout, DailyLogFile(log_dir, "app", settings.LOG_RETENTION_DAYS)],
+            render      = render_json,
+            queue_size  = settings.LOG_QUEUE_SIZE,
+            batch_size  = settings.LOG_BATCH_SIZE
+        )
+        logger.add(_writer, format="{message}", level="DEBUG", catch=True)
+    else:
+        text_format = (
+            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+            "<level>{level: <8}</level> | "
+            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+            "<level>{message}</level>"
+        )
+
+        logger.add(sys.stdout, format=text_format, colorize=True, diagnose=False, catch=True)
+
+        # Current
+        logger.add(
+            log_dir / "app.log"
+            , format        =text_format
+            , level         ="DEBUG"
+            , colorize      =False
+            , catch         =True
+        )
+
+        # On backup
+        logger.add(
+            log_dir / "app-{time:DD-MM-YY}.log"
+            , format        =text_format
+            , rotation      ="00:00"
+            , retention     =f"{settings.LOG_RETENTION_DAYS} days"
+            , compression   ="zip"
+            , level         ="DEBUG"
+            , colorize      =False
+            , catch         =True
+        )
 
     logger.level("ERROR", color="<red>")
     logger.level("WARNING", color="<yellow>")
@@ -86,8 +265,12 @@ def setup_logging():
         if name.startswith("uvicorn."):
             logging.getLogger(name).handlers = []
 
+    if not _configured:
+        atexit.register(shutdown_logging)
+    _configured = True
+
     return logger
 
 
 
-logger  = setup_logging()
\ No newline at end of file
+logger  = setup_logging()
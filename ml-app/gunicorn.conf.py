@@ -0,0 +1,35 @@
+"""
+Production launcher: ``gunicorn -c gunicorn.conf.py main:app`` (or ``python run.py``
+with DEBUG off).
+
+The model is loaded once in the master and shared copy-on-write by the
+forked workers. ``kill -HUP <master>`` replaces workers gracefully; to pick
+up new code or a new model, use ``kill -USR2 <master>`` followed by
+``kill -QUIT <old master>``, or set GUNICORN_PRELOAD=false.
+"""
+import multiprocessing
+import os
+import sys
+
+workers             = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class        = "uvicorn.workers.UvicornWorker"
+bind                = f"{os.environ.get('API_HOST', '0.0.0.0')}:{os.environ.get('API_PORT', '8000')}"
+preload_app         = os.environ.get("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes")
+
+# Inference on large images can legitimately take a while.
+timeout             = int(os.environ.get("GUNICORN_TIMEOUT", "120"))
+graceful_timeout    = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive           = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+max_requests        = int(os.environ.get("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+def post_fork(server, worker):
+    # The preloaded master's JSON log writer thread does not survive the fork.
+    if "app.core.logger" in sys.modules:
+        from app.core.logger import restart_logging_after_fork
+        restart_logging_after_fork()
+
+    # Each worker would otherwise start one torch thread per core, so N
+    # workers oversubscribe the machine N times over.
+    import torch
+    torch.set_num_threads(max(1, multiprocessing.cpu_count() // workers))
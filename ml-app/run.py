@@ -1,10 +1,15 @@
+import os
+
 import uvicorn
 from app.core.config import settings
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app"
-        , host      = settings.API_HOST
-        , port      = settings.API_PORT
-        , reload    = settings.DEBUG
-    )
\ No newline at end of file
+    if settings.DEBUG:
+        uvicorn.run(
+            "main:app"
+            , host      = settings.API_HOST
+            , port      = settings.API_PORT
+            , reload    = True
+        )
+    else:
+        os.execvp("gunicorn", ["gunicorn", "-c", "gunicorn.conf.py", "main:app"])